@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from contextlib import AsyncExitStack
-import inspect
 from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
+from weakref import WeakKeyDictionary
 
+from .di import ResourceBag
 from .errors import HTTPError
 from .request import Request
 from .response import Response, to_response
 from .router import Router
-from .utils import encode_json
+from .utils import encode_json, is_awaitable
 from .websocket import WebSocket
 
 
@@ -21,8 +22,18 @@ class BardApp:
         self._http_middlewares: list[Callable[[Request, Callable[[], Awaitable[Any]]], Awaitable[Any]]] = []
         self._ws_middlewares: list[Callable[[WebSocket, Callable[[], Awaitable[Any]]], Awaitable[Any]]] = []
         self._exception_handlers: dict[type[BaseException], Callable[[Any, BaseException], Any]] = {}
+        self._resolved_exception_handlers: WeakKeyDictionary[
+            type[BaseException], Callable[[Any, BaseException], Any] | None
+        ] = WeakKeyDictionary()
+        self._http_chains: dict[Any, tuple[int, tuple[Callable, ...]]] = {}
+        self._ws_chains: dict[Any, tuple[int, tuple[Callable, ...]]] = {}
         self._lifespan_cm = None
         self._lifespan_active = False
+        self._scope_handlers: dict[str, Callable[[Any, Any, Any], Awaitable[None]]] = {
+            "http": self._handle_http,
+            "lifespan": self._handle_lifespan,
+            "websocket": self._handle_websocket,
+        }
         self.router.compile()
 
     def provide(self, key: object, provider, *, use_cache: bool = True) -> None:
@@ -33,12 +44,14 @@ class BardApp:
         middleware: Callable[[Request, Callable[[], Awaitable[Any]]], Awaitable[Any]],
     ) -> None:
         self._http_middlewares.append(middleware)
+        self._http_chains.clear()
 
     def add_websocket_middleware(
         self,
         middleware: Callable[[WebSocket, Callable[[], Awaitable[Any]]], Awaitable[Any]],
     ) -> None:
         self._ws_middlewares.append(middleware)
+        self._ws_chains.clear()
 
     def add_exception_handler(
         self,
@@ -46,23 +59,18 @@ class BardApp:
         handler: Callable[[Any, BaseException], Any],
     ) -> None:
         self._exception_handlers[exc_type] = handler
+        self._resolved_exception_handlers.clear()
 
     async def __call__(self, scope, receive, send) -> None:
-        scope_type = scope.get("type")
-        if scope_type == "http":
-            await self._handle_http(scope, receive, send)
-            return
-        if scope_type == "lifespan":
-            await self._handle_lifespan(receive, send)
-            return
-        if scope_type == "websocket":
-            await self._handle_websocket(scope, receive, send)
-            return
+        handler = self._scope_handlers.get(scope.get("type"))
+        if handler is not None:
+            await handler(scope, receive, send)
 
     async def _handle_http(self, scope, receive, send) -> None:
-        async with AsyncExitStack() as exit_stack:
+        exit_stack = ResourceBag()
+        try:
             request = Request(scope, receive, self.state, exit_stack=exit_stack)
-            handler, params = self.router.match(scope.get("method", ""), scope.get("path", ""))
+            handler, params = self.router._match(scope.get("method", ""), scope.get("path", ""))
             if handler is None:
                 await Response(b"Not Found", status=404)(send)
                 return
@@ -86,8 +94,15 @@ class BardApp:
                         pass
                 await self._send_error(send, "Internal Server Error", 500)
                 return
+        except BaseException as exc:
+            if exit_stack and await exit_stack.aclose(type(exc), exc, exc.__traceback__):
+                return
+            raise
+        finally:
+            if exit_stack:
+                await exit_stack.aclose()
 
-    async def _handle_lifespan(self, receive, send) -> None:
+    async def _handle_lifespan(self, scope, receive, send) -> None:
         message = await receive()
         if message.get("type") != "lifespan.startup":
             return
@@ -111,9 +126,10 @@ class BardApp:
         if message.get("type") != "websocket.connect":
             return
 
-        async with AsyncExitStack() as exit_stack:
+        exit_stack = ResourceBag()
+        try:
             ws = WebSocket(scope, receive, send, self.state, exit_stack=exit_stack)
-            handler, params = self.router.match("WEBSOCKET", scope.get("path", ""))
+            handler, params = self.router._match("WEBSOCKET", scope.get("path", ""))
             if handler is None:
                 await ws.close(code=1000)
                 return
@@ -129,6 +145,13 @@ class BardApp:
             finally:
                 if not ws.closed:
                     await ws.close(code=1000)
+        except BaseException as exc:
+            if exit_stack and await exit_stack.aclose(type(exc), exc, exc.__traceback__):
+                return
+            raise
+        finally:
+            if exit_stack:
+                await exit_stack.aclose()
 
     async def _await_shutdown(self, receive, send) -> None:
         message = await receive()
@@ -176,54 +199,61 @@ class BardApp:
         await response(send)
 
     async def _dispatch_http(self, request: Request, handler, params: dict[str, str]) -> Any:
-        async def endpoint() -> Any:
+        route_middlewares = handler.middlewares
+        chain = self._http_chains.get(handler)
+        if chain is None or chain[0] != len(route_middlewares):
+            chain = (len(route_middlewares), (*self._http_middlewares, *route_middlewares))
+            self._http_chains[handler] = chain
+        middlewares = chain[1]
+        if not middlewares:
             return await handler(request, params)
-
-        route_middlewares = getattr(handler, "middlewares", ())
-        all_middlewares = [*self._http_middlewares, *route_middlewares]
-
-        call_next = endpoint
-        for middleware in reversed(all_middlewares):
-            next_call = call_next
-
-            async def call_next_bound(
-                middleware=middleware,
-                next_call=next_call,
-            ) -> Any:
-                return await middleware(request, next_call)
-
-            call_next = call_next_bound
-
-        return await call_next()
+        return await _call_chain(request, handler, params, middlewares, 0)
 
     async def _handle_exception(self, request: Any, exc: BaseException) -> Any | None:
-        for exc_type in type(exc).__mro__:
+        exc_class = type(exc)
+        try:
+            handler = self._resolved_exception_handlers[exc_class]
+        except KeyError:
+            handler = self._resolve_exception_handler(exc_class)
+            self._resolved_exception_handlers[exc_class] = handler
+        if handler is None:
+            return None
+        result = handler(request, exc)
+        if is_awaitable(result):
+            return await result
+        return result
+
+    def _resolve_exception_handler(
+        self,
+        exc_class: type[BaseException],
+    ) -> Callable[[Any, BaseException], Any] | None:
+        for exc_type in exc_class.__mro__:
             handler = self._exception_handlers.get(exc_type)
-            if handler is None:
-                continue
-            result = handler(request, exc)
-            if inspect.isawaitable(result):
-                return await result
-            return result
+            if handler is not None:
+                return handler
         return None
 
     async def _dispatch_websocket(self, ws: WebSocket, handler, params: dict[str, str]) -> Any:
-        async def endpoint() -> Any:
+        route_middlewares = handler.middlewares
+        chain = self._ws_chains.get(handler)
+        if chain is None or chain[0] != len(route_middlewares):
+            chain = (len(route_middlewares), (*self._ws_middlewares, *route_middlewares))
+            self._ws_chains[handler] = chain
+        middlewares = chain[1]
+        if not middlewares:
             return await handler(ws, params)
+        return await _call_chain(ws, handler, params, middlewares, 0)
 
-        route_middlewares = getattr(handler, "middlewares", ())
-        all_middlewares = [*self._ws_middlewares, *route_middlewares]
-
-        call_next = endpoint
-        for middleware in reversed(all_middlewares):
-            next_call = call_next
-
-            async def call_next_bound(
-                middleware=middleware,
-                next_call=next_call,
-            ) -> Any:
-                return await middleware(ws, next_call)
 
-            call_next = call_next_bound
+async def _call_chain(
+    connection: Any,
+    handler,
+    params: dict[str, str],
+    middlewares: tuple[Callable, ...],
+    index: int,
+) -> Any:
+    if index == len(middlewares):
+        return await handler(connection, params)
 
-        return await call_next()
+    call_next = partial(_call_chain, connection, handler, params, middlewares, index + 1)
+    return await middlewares[index](connection, call_next)
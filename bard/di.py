@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
+from types import TracebackType
 from typing import Any, Callable
 
+from .utils import is_awaitable
+
+
+_PLAIN_RESOURCE_TYPES = frozenset({bool, int, float, str, bytes, dict, list, tuple, set, frozenset})
+
 
 ProviderCallable = Callable[..., Any]
 
@@ -30,6 +37,7 @@ class Depends:
 class ProviderRegistry:
     def __init__(self) -> None:
         self._providers: dict[object, ProviderSpec] = {}
+        self._depends_keys: dict[ProviderCallable, object] = {}
 
     def provide(
         self,
@@ -49,9 +57,118 @@ class ProviderRegistry:
     def items(self):
         return self._providers.items()
 
+    def depends_key(self, provider: ProviderCallable) -> object:
+        key = self._depends_keys.get(provider)
+        if key is None:
+            key = _DependsKey(provider)
+            self._depends_keys[provider] = key
+        return key
+
+
+class _DependsKey:
+    __slots__ = ("provider",)
+
+    def __init__(self, provider: ProviderCallable) -> None:
+        self.provider = provider
+
+    def __repr__(self) -> str:
+        return f"_DependsKey({self.provider!r})"
+
+
+class ResourceBag:
+    __slots__ = ("_callbacks",)
+
+    def __init__(self) -> None:
+        self._callbacks: list[tuple[bool, Callable[..., Any]]] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self._callbacks)
+
+    def enter_context(self, cm: Any) -> Any:
+        value = cm.__enter__()
+        self._push(False, cm.__exit__)
+        return value
+
+    async def enter_async_context(self, cm: Any) -> Any:
+        value = await cm.__aenter__()
+        self._push(True, cm.__aexit__)
+        return value
 
-async def enter_resource(stack: AsyncExitStack | None, value: Any) -> Any:
-    if stack is None:
+    def callback(self, fn: Callable[[], Any]) -> None:
+        def exit_callback(exc_type, exc, tb) -> None:
+            fn()
+
+        self._push(False, exit_callback)
+
+    def push_async_callback(self, fn: Callable[[], Any]) -> None:
+        async def exit_callback(exc_type, exc, tb) -> None:
+            await fn()
+
+        self._push(True, exit_callback)
+
+    async def aclose(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc: BaseException | None = None,
+        tb: TracebackType | None = None,
+    ) -> bool:
+        callbacks = self._callbacks
+        if not callbacks:
+            return False
+        received_exc = exc is not None
+        frame_exc = sys.exc_info()[1]
+        suppressed = False
+        pending_raise = False
+        while callbacks:
+            is_async, fn = callbacks.pop()
+            try:
+                if is_async:
+                    result = await fn(exc_type, exc, tb)
+                else:
+                    result = fn(exc_type, exc, tb)
+                if result:
+                    suppressed = True
+                    pending_raise = False
+                    exc_type, exc, tb = None, None, None
+            except BaseException as new_exc:
+                _fix_exception_context(new_exc, exc, frame_exc)
+                pending_raise = True
+                exc_type, exc, tb = type(new_exc), new_exc, new_exc.__traceback__
+        if pending_raise and exc is not None:
+            context = exc.__context__
+            try:
+                raise exc
+            except BaseException:
+                exc.__context__ = context
+                raise
+        return received_exc and suppressed
+
+    def _push(self, is_async: bool, fn: Callable[..., Any]) -> None:
+        if self._callbacks is None:
+            self._callbacks = [(is_async, fn)]
+        else:
+            self._callbacks.append((is_async, fn))
+
+
+def _fix_exception_context(
+    new_exc: BaseException,
+    old_exc: BaseException | None,
+    frame_exc: BaseException | None,
+) -> None:
+    if old_exc is None or new_exc is old_exc:
+        return
+    while True:
+        context = new_exc.__context__
+        if context is old_exc:
+            return
+        if context is None or context is frame_exc:
+            break
+        new_exc = context
+    new_exc.__context__ = old_exc
+
+
+async def enter_resource(stack: ResourceBag | AsyncExitStack | None, value: Any) -> Any:
+    if stack is None or value is None or type(value) in _PLAIN_RESOURCE_TYPES:
         return value
     if hasattr(value, "__aenter__") and hasattr(value, "__aexit__"):
         return await stack.enter_async_context(value)  # type: ignore[arg-type]
@@ -64,7 +181,7 @@ async def enter_resource(stack: AsyncExitStack | None, value: Any) -> Any:
         else:
             async def _awaitable_close() -> None:
                 result = aclose()
-                if inspect.isawaitable(result):
+                if is_awaitable(result):
                     await result
 
             stack.push_async_callback(_awaitable_close)
@@ -40,9 +40,16 @@ class File(_Extractor):
     __slots__ = ()
 
 
+_DEFAULT_EXTRACTORS: dict[type[_Extractor], _Extractor] = {}
+
+
 def normalize_extractor(meta: object) -> _Extractor | None:
     if isinstance(meta, _Extractor):
         return meta
     if isinstance(meta, type) and issubclass(meta, _Extractor):
-        return meta()
+        extractor = _DEFAULT_EXTRACTORS.get(meta)
+        if extractor is None:
+            extractor = meta()
+            _DEFAULT_EXTRACTORS[meta] = extractor
+        return extractor
     return None
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
-from urllib.parse import parse_qs
 
+from .utils import parse_query_string
 
-@dataclass
+_CRLF = b"\r\n"
+_CONTENT_DISPOSITION = b"content-disposition"
+_CONTENT_TYPE = b"content-type"
+_EMPTY_PARAMS: Mapping[str, str] = MappingProxyType({})
+_MAX_PART_HEADER_SIZE = 16 * 1024
+_PREAMBLE, _AFTER_DELIMITER, _HEADERS, _BODY = range(4)
+_FORM_MEDIA_TYPES = frozenset(("application/x-www-form-urlencoded", "multipart/form-data"))
+
+
+@dataclass(slots=True)
 class UploadFile:
     filename: str | None
     content_type: str | None
@@ -15,7 +27,7 @@ class UploadFile:
         return self.content.decode(encoding, errors="replace")
 
 
-@dataclass
+@dataclass(slots=True)
 class FormData:
     fields: dict[str, list[str]] = field(default_factory=dict)
     files: dict[str, list[UploadFile]] = field(default_factory=dict)
@@ -37,72 +49,208 @@ class FormData:
 
 
 def parse_form(body: bytes, content_type: str) -> FormData:
-    mime_type, params = _parse_content_type(content_type)
+    mime_type, _ = _parse_content_type(content_type)
     if mime_type == "application/x-www-form-urlencoded":
         return _parse_urlencoded(body)
-    if mime_type == "multipart/form-data":
-        boundary = params.get("boundary")
-        if not boundary:
-            raise ValueError("Missing multipart boundary")
-        return _parse_multipart(body, boundary.encode("latin-1"))
+    boundary = multipart_boundary(content_type)
+    if boundary is not None:
+        return _parse_multipart(body, boundary)
     return FormData()
 
 
-def _parse_urlencoded(body: bytes) -> FormData:
-    parsed = parse_qs(body.decode("latin-1"), keep_blank_values=True)
-    return FormData(fields={key: list(values) for key, values in parsed.items()})
+def is_form_content_type(content_type: str) -> bool:
+    return _parse_content_type(content_type)[0] in _FORM_MEDIA_TYPES
 
 
-def _parse_multipart(body: bytes, boundary: bytes) -> FormData:
-    form = FormData()
-    marker = b"--" + boundary
-    parts = body.split(marker)
-    for part in parts:
-        if not part or part == b"--\r\n" or part == b"--":
-            continue
-        part = part.lstrip(b"\r\n")
-        if part.endswith(b"--"):
-            part = part[:-2]
-        part = part.rstrip(b"\r\n")
-        if not part:
-            continue
-        header_blob, _, content = part.partition(b"\r\n\r\n")
-        headers = _parse_headers(header_blob)
-        disposition = headers.get("content-disposition", "")
-        disp, disp_params = _parse_disposition(disposition)
-        if disp != "form-data":
-            continue
-        name = disp_params.get("name")
-        if not name:
-            continue
-        filename = disp_params.get("filename")
+def multipart_boundary(content_type: str) -> bytes | None:
+    mime_type, params = _parse_content_type(content_type)
+    if mime_type != "multipart/form-data":
+        return None
+    boundary = params.get("boundary")
+    if not boundary:
+        raise ValueError("Missing multipart boundary")
+    return boundary.encode("latin-1")
+
+
+class MultipartParser:
+    __slots__ = ("form", "_delimiter", "_buffer", "_state", "_part", "_content")
+
+    def __init__(self, boundary: bytes) -> None:
+        self.form = FormData()
+        self._delimiter = b"\r\n--" + boundary
+        self._buffer = bytearray(b"\r\n")
+        self._state = _PREAMBLE
+        self._part: tuple[str, str | None, str | None] | None = None
+        self._content = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        self._buffer += chunk
+        buffer = self._buffer
+        delimiter = self._delimiter
+        delimiter_len = len(delimiter)
+        while True:
+            state = self._state
+            if state == _PREAMBLE:
+                index = buffer.find(delimiter)
+                if index == -1:
+                    _keep_tail(buffer, delimiter_len - 1)
+                    return
+                del buffer[: index + delimiter_len]
+                self._state = _AFTER_DELIMITER
+            elif state == _AFTER_DELIMITER:
+                if len(buffer) < 2:
+                    return
+                self._state = _PREAMBLE if buffer.startswith(b"--") else _HEADERS
+            elif state == _HEADERS:
+                index = buffer.find(delimiter)
+                limit = len(buffer) if index == -1 else index
+                start = _skip_crlf(buffer, 0, limit)
+                separator = buffer.find(b"\r\n\r\n", start, limit)
+                if separator != -1:
+                    self._part = _part_info(bytes(buffer[start:separator]))
+                    del buffer[: separator + 4]
+                    self._state = _BODY
+                    continue
+                if index == -1:
+                    if limit - start > _MAX_PART_HEADER_SIZE:
+                        raise ValueError("Multipart part headers too large")
+                    return
+                if start < index:
+                    self._part = _part_info(bytes(buffer[start:index]))
+                    self._add_part(b"")
+                del buffer[: index + delimiter_len]
+                self._state = _AFTER_DELIMITER
+            else:
+                index = buffer.find(delimiter)
+                if index == -1:
+                    cut = len(buffer) - (delimiter_len - 1)
+                    if cut > 0:
+                        if self._part is not None:
+                            self._content += buffer[:cut]
+                        del buffer[:cut]
+                    return
+                if self._part is not None:
+                    if self._content:
+                        self._content += buffer[:index]
+                        content = bytes(self._content)
+                        self._content.clear()
+                    else:
+                        content = _take(buffer, index)
+                    self._add_part(content)
+                del buffer[: index + delimiter_len]
+                self._state = _AFTER_DELIMITER
+
+    def finish(self) -> FormData:
+        buffer = self._buffer
+        state = self._state
+        if state == _HEADERS:
+            start = _skip_crlf(buffer, 0, len(buffer))
+            end = _trim_crlf(buffer, start, len(buffer))
+            if start < end:
+                separator = buffer.find(b"\r\n\r\n", start, end)
+                if separator == -1:
+                    self._part = _part_info(bytes(buffer[start:end]))
+                    self._add_part(b"")
+                else:
+                    self._part = _part_info(bytes(buffer[start:separator]))
+                    self._add_part(bytes(buffer[separator + 4 : end]))
+        elif state == _BODY and self._part is not None:
+            self._content += buffer
+            end = _trim_crlf(self._content, 0, len(self._content))
+            self._add_part(bytes(self._content[:end]))
+        buffer.clear()
+        self._content.clear()
+        self._state = _PREAMBLE
+        return self.form
+
+    def _add_part(self, content: bytes) -> None:
+        part = self._part
+        self._part = None
+        if part is None:
+            return
+        name, filename, content_type = part
         if filename is not None:
-            upload = UploadFile(
-                filename=filename,
-                content_type=headers.get("content-type"),
-                content=content,
-            )
-            form.files.setdefault(name, []).append(upload)
+            upload = UploadFile(filename=filename, content_type=content_type, content=content)
+            uploads = self.form.files.get(name)
+            if uploads is None:
+                self.form.files[name] = [upload]
+            else:
+                uploads.append(upload)
         else:
             value = content.decode("utf-8", errors="replace")
-            form.fields.setdefault(name, []).append(value)
-    return form
+            values = self.form.fields.get(name)
+            if values is None:
+                self.form.fields[name] = [value]
+            else:
+                values.append(value)
 
 
-def _parse_headers(blob: bytes) -> dict[str, str]:
-    headers: dict[str, str] = {}
-    for line in blob.split(b"\r\n"):
-        if not line:
-            continue
-        key, _, value = line.partition(b":")
-        headers[key.decode("latin-1").strip().lower()] = value.decode("latin-1").strip()
-    return headers
+def _parse_urlencoded(body: bytes) -> FormData:
+    return FormData(fields=parse_query_string(body))
+
+
+def _parse_multipart(body: bytes, boundary: bytes) -> FormData:
+    parser = MultipartParser(boundary)
+    parser.feed(body)
+    return parser.finish()
+
+
+def _part_info(header_blob: bytes) -> tuple[str, str | None, str | None] | None:
+    disposition = ""
+    content_type: str | None = None
+    lowered = header_blob.lower()
+    blob_len = len(header_blob)
+    start = 0
+    while start < blob_len:
+        end = lowered.find(b"\r\n", start)
+        if end == -1:
+            end = blob_len
+        colon = lowered.find(b":", start, end)
+        if colon == -1:
+            colon = end
+        key = lowered[start:colon].strip()
+        if key == _CONTENT_DISPOSITION:
+            disposition = header_blob[colon + 1 : end].decode("latin-1").strip()
+        elif key == _CONTENT_TYPE:
+            content_type = header_blob[colon + 1 : end].decode("latin-1").strip()
+        start = end + 2
+    disp, disp_params = _parse_disposition(disposition)
+    if disp != "form-data":
+        return None
+    name = disp_params.get("name")
+    if not name:
+        return None
+    return name, disp_params.get("filename"), content_type
+
+
+def _skip_crlf(buffer: bytearray, start: int, end: int) -> int:
+    while start < end and buffer[start] in _CRLF:
+        start += 1
+    return start
+
+
+def _trim_crlf(buffer: bytearray, start: int, end: int) -> int:
+    while end > start and buffer[end - 1] in _CRLF:
+        end -= 1
+    return end
+
+
+def _keep_tail(buffer: bytearray, size: int) -> None:
+    excess = len(buffer) - size
+    if excess > 0:
+        del buffer[:excess]
+
+
+def _take(buffer: bytearray, end: int) -> bytes:
+    with memoryview(buffer) as view, view[:end] as part:
+        return bytes(part)
 
 
-def _parse_disposition(value: str) -> tuple[str, dict[str, str]]:
+@lru_cache(maxsize=256)
+def _parse_disposition(value: str) -> tuple[str, Mapping[str, str]]:
     parts = [part.strip() for part in value.split(";") if part.strip()]
     if not parts:
-        return "", {}
+        return "", _EMPTY_PARAMS
     disposition = parts[0].lower()
     params: dict[str, str] = {}
     for part in parts[1:]:
@@ -110,13 +258,14 @@ def _parse_disposition(value: str) -> tuple[str, dict[str, str]]:
             continue
         key, raw = part.split("=", 1)
         params[key.strip().lower()] = raw.strip().strip('"')
-    return disposition, params
+    return disposition, MappingProxyType(params)
 
 
-def _parse_content_type(value: str) -> tuple[str, dict[str, str]]:
+@lru_cache(maxsize=256)
+def _parse_content_type(value: str) -> tuple[str, Mapping[str, str]]:
     parts = [part.strip() for part in value.split(";") if part.strip()]
     if not parts:
-        return "", {}
+        return "", _EMPTY_PARAMS
     mime_type = parts[0].lower()
     params: dict[str, str] = {}
     for part in parts[1:]:
@@ -124,4 +273,4 @@ def _parse_content_type(value: str) -> tuple[str, dict[str, str]]:
             continue
         key, raw = part.split("=", 1)
         params[key.strip().lower()] = raw.strip().strip('"')
-    return mime_type, params
+    return mime_type, MappingProxyType(params)
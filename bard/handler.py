@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Awaitable, Callable
-from types import UnionType
+from collections.abc import Callable, Sequence
+from types import FunctionType, UnionType
 from typing import Any, Annotated, Union, get_args, get_origin, get_type_hints
+from weakref import WeakKeyDictionary
 
 import msgspec
 
@@ -12,7 +13,7 @@ from .errors import HTTPError
 from .extractors import File, Form, Header, Json, Path, Query, State, normalize_extractor
 from .form import FormData, UploadFile
 from .request import Request
-from .utils import convert_value, decode_json, is_optional_type
+from .utils import is_awaitable, is_optional_type, json_decoder, value_converter
 from .websocket import WebSocket
 
 try:
@@ -22,8 +23,11 @@ except Exception:  # pragma: no cover - optional at runtime
 
 _MISSING = object()
 
+_PARAMETERS_CACHE: WeakKeyDictionary[Callable, tuple[inspect.Parameter, ...]] = WeakKeyDictionary()
+_TYPE_HINTS_CACHE: WeakKeyDictionary[Callable, tuple[bool, dict[str, Any]]] = WeakKeyDictionary()
 
-Resolver = Callable[[Request, dict[str, str]], Awaitable[Any]]
+
+Resolver = Callable[[Request, dict[str, str]], Any]
 
 
 class MissingProviderError(TypeError):
@@ -31,20 +35,76 @@ class MissingProviderError(TypeError):
 
 
 class CompiledHandler:
-    def __init__(self, handler, resolvers: list[tuple[str, Any]]):
+    def __init__(self, handler, resolvers: list[tuple[str, Any]], *, positional: bool = False):
         self._handler = handler
-        self._resolvers = resolvers
+        self._names = tuple(name for name, _ in resolvers)
+        self._resolvers = tuple(
+            (resolver, inspect.iscoroutinefunction(resolver)) for _, resolver in resolvers
+        )
+        self._positional = positional
+        self._collect = _fuse_sync_resolvers(self._resolvers)
+        self._is_async = inspect.iscoroutinefunction(handler)
 
     async def __call__(self, request: Request, path_params: dict[str, str]):
-        kwargs = {}
-        for name, resolver in self._resolvers:
-            kwargs[name] = await resolver(request, path_params)
-        result = self._handler(**kwargs)
-        if inspect.isawaitable(result):
+        collect = self._collect
+        if collect is not None:
+            args = collect(request, path_params)
+        else:
+            args = []
+            for resolver, is_async in self._resolvers:
+                value = resolver(request, path_params)
+                if is_async:
+                    value = await value
+                args.append(value)
+        if self._positional:
+            result = self._handler(*args)
+        else:
+            result = self._handler(**dict(zip(self._names, args)))
+        if self._is_async or is_awaitable(result):
             return await result
         return result
 
 
+def _fuse_sync_resolvers(
+    resolvers: tuple[tuple[Resolver, bool], ...],
+) -> Callable[[Request, dict[str, str]], Sequence[Any]] | None:
+    if any(is_async for _, is_async in resolvers):
+        return None
+    funcs = tuple(resolver for resolver, _ in resolvers)
+    if not funcs:
+        return _collect_nothing
+    if len(funcs) == 1:
+        (first,) = funcs
+
+        def collect_one(request: Request, path_params: dict[str, str]) -> tuple[Any, ...]:
+            return (first(request, path_params),)
+
+        return collect_one
+    if len(funcs) == 2:
+        first, second = funcs
+
+        def collect_two(request: Request, path_params: dict[str, str]) -> tuple[Any, ...]:
+            return first(request, path_params), second(request, path_params)
+
+        return collect_two
+    if len(funcs) == 3:
+        first, second, third = funcs
+
+        def collect_three(request: Request, path_params: dict[str, str]) -> tuple[Any, ...]:
+            return first(request, path_params), second(request, path_params), third(request, path_params)
+
+        return collect_three
+
+    def collect_many(request: Request, path_params: dict[str, str]) -> list[Any]:
+        return [resolver(request, path_params) for resolver in funcs]
+
+    return collect_many
+
+
+def _collect_nothing(request: Request, path_params: dict[str, str]) -> tuple[Any, ...]:
+    return ()
+
+
 def compile_handler(
     handler,
     *,
@@ -52,13 +112,16 @@ def compile_handler(
     providers: ProviderRegistry | None = None,
     compiled_cache: dict[Callable, CompiledHandler] | None = None,
 ) -> CompiledHandler:
-    signature = inspect.signature(handler)
-    type_hints = _resolve_type_hints(handler, localns=localns)
+    parameters = _handler_parameters(handler)
+    type_hints = _cached_type_hints(handler, localns)
     resolvers: list[tuple[str, Any]] = []
+    positional = _uses_own_code(handler)
 
-    for param in signature.parameters.values():
+    for param in parameters:
         if param.kind not in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
             raise TypeError(f"Unsupported parameter kind for {param.name}")
+        if param.kind is param.KEYWORD_ONLY:
+            positional = False
         annotation = type_hints.get(param.name, param.annotation)
         resolver = _compile_param(
             param,
@@ -69,7 +132,78 @@ def compile_handler(
         )
         resolvers.append((param.name, resolver))
 
-    return CompiledHandler(handler, resolvers)
+    return CompiledHandler(handler, resolvers, positional=positional)
+
+
+def _handler_parameters(handler) -> tuple[inspect.Parameter, ...]:
+    try:
+        return _PARAMETERS_CACHE[handler]
+    except (KeyError, TypeError):
+        pass
+    parameters = _function_parameters(handler)
+    if parameters is None:
+        parameters = tuple(inspect.signature(handler).parameters.values())
+    try:
+        _PARAMETERS_CACHE[handler] = parameters
+    except TypeError:
+        pass
+    return parameters
+
+
+def _uses_own_code(handler) -> bool:
+    if type(handler) is not FunctionType:
+        return False
+    if hasattr(handler, "__wrapped__") or hasattr(handler, "__signature__"):
+        return False
+    return not handler.__code__.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+
+
+def _function_parameters(handler) -> tuple[inspect.Parameter, ...] | None:
+    if not _uses_own_code(handler):
+        return None
+    code = handler.__code__
+    posonly_count = code.co_posonlyargcount
+    arg_count = code.co_argcount
+    defaults = handler.__defaults__ or ()
+    kwdefaults = handler.__kwdefaults__ or {}
+    annotations = handler.__annotations__
+    first_default = arg_count - len(defaults)
+    parameters: list[inspect.Parameter] = []
+    for index, name in enumerate(code.co_varnames[: arg_count + code.co_kwonlyargcount]):
+        if index < posonly_count:
+            kind = inspect.Parameter.POSITIONAL_ONLY
+        elif index < arg_count:
+            kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+        else:
+            kind = inspect.Parameter.KEYWORD_ONLY
+        if index >= arg_count:
+            default = kwdefaults.get(name, inspect._empty)
+        elif index >= first_default:
+            default = defaults[index - first_default]
+        else:
+            default = inspect._empty
+        annotation = annotations.get(name, inspect._empty)
+        parameters.append(inspect.Parameter(name, kind, default=default, annotation=annotation))
+    return tuple(parameters)
+
+
+def _cached_type_hints(handler, localns: dict[str, Any] | None) -> dict[str, Any]:
+    uses_globals = localns is not None
+    if uses_globals and localns is not getattr(handler, "__globals__", None):
+        return _resolve_type_hints(handler, localns=localns)
+    try:
+        cached_uses_globals, hints = _TYPE_HINTS_CACHE[handler]
+    except (KeyError, TypeError):
+        pass
+    else:
+        if cached_uses_globals is uses_globals:
+            return hints
+    hints = _resolve_type_hints(handler, localns=localns)
+    try:
+        _TYPE_HINTS_CACHE[handler] = (uses_globals, hints)
+    except TypeError:
+        pass
+    return hints
 
 
 def _resolve_type_hints(handler, localns: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -80,7 +214,7 @@ def _resolve_type_hints(handler, localns: dict[str, Any] | None = None) -> dict[
                 resolved_locals[name] = cell.cell_contents
             except ValueError:
                 continue
-    if localns:
+    if localns and localns is not handler.__globals__:
         resolved_locals.update(localns)
     try:
         return get_type_hints(
@@ -110,7 +244,7 @@ def _compile_param(
         isinstance(annotation, type) and issubclass(annotation, Request)
     ):
 
-        async def resolve_request(request: Request, path_params: dict[str, str]) -> Request:
+        def resolve_request(request: Request, path_params: dict[str, str]) -> Request:
             return request
 
         return resolve_request
@@ -119,7 +253,7 @@ def _compile_param(
         isinstance(annotation, type) and issubclass(annotation, WebSocket)
     ):
 
-        async def resolve_ws(request: Request, path_params: dict[str, str]) -> WebSocket:
+        def resolve_ws(request: Request, path_params: dict[str, str]) -> WebSocket:
             return request  # type: ignore[return-value]
 
         return resolve_ws
@@ -141,12 +275,16 @@ def _compile_param(
 
     if extractor is None:
         if depends is not None:
+            if providers is not None:
+                cache_key = providers.depends_key(depends.provider)
+            else:
+                cache_key = ("depends", depends.provider)
             return _compile_dependency(
                 param.name,
                 target_type,
                 depends.provider,
                 default=default,
-                cache_key=("depends", depends.provider),
+                cache_key=cache_key,
                 use_cache=depends.use_cache,
                 providers=providers,
                 localns=callsite_localns,
@@ -160,58 +298,68 @@ def _compile_param(
             compiled_cache=compiled_cache,
         )
 
+    missing = _missing_value(param.name, default, target_type)
+    is_list = _is_list_type(target_type)
+    convert = value_converter(target_type)
+
     if isinstance(extractor, Json):
+        decode = json_decoder(target_type)
+        message = f"Invalid JSON for {param.name}"
 
         async def resolve_json(request: Request, path_params: dict[str, str]) -> Any:
             body = await request.body()
             if not body:
-                return _default_or_error(param.name, default, target_type)
+                return missing()
             try:
-                return decode_json(body, target_type)
+                return decode(body)
             except (msgspec.DecodeError, msgspec.ValidationError) as exc:
-                raise HTTPError(422, f"Invalid JSON for {param.name}") from exc
+                raise HTTPError(422, message) from exc
             except Exception as exc:
                 if PydanticValidationError and isinstance(exc, PydanticValidationError):
-                    raise HTTPError(422, f"Invalid JSON for {param.name}") from exc
+                    raise HTTPError(422, message) from exc
                 raise
 
         return resolve_json
 
     if isinstance(extractor, Query):
         key = extractor.name or param.name
+        message = f"Invalid query parameter {key}"
 
-        async def resolve_query(request: Request, path_params: dict[str, str]) -> Any:
+        def resolve_query(request: Request, path_params: dict[str, str]) -> Any:
             values = request.query_params.get(key)
             if values is None:
-                return _default_or_error(param.name, default, target_type)
-            value = values if _is_list_type(target_type) else values[0]
-            return _convert_or_error(value, target_type, f"Invalid query parameter {key}")
+                return missing()
+            value = values if is_list else values[0]
+            return _convert_or_error(value, convert, message)
 
         return resolve_query
 
     if isinstance(extractor, Form):
         key = extractor.name or param.name
+        whole_form = extractor.name is None and target_type is FormData
+        flatten = extractor.name is None and (target_type is dict or get_origin(target_type) is dict)
+        message = f"Invalid form field {key}"
 
         async def resolve_form(request: Request, path_params: dict[str, str]) -> Any:
             try:
                 form = await request.form()
             except Exception as exc:
                 raise HTTPError(400, "Invalid form data") from exc
-            if extractor.name is None:
-                if target_type is FormData:
-                    return form
-                if target_type is dict or get_origin(target_type) is dict:
-                    return _flatten_fields(form.fields)
+            if whole_form:
+                return form
+            if flatten:
+                return _flatten_fields(form.fields)
             values = form.fields.get(key)
             if values is None:
-                return _default_or_error(param.name, default, target_type)
-            value = values if _is_list_type(target_type) else values[0]
-            return _convert_or_error(value, target_type, f"Invalid form field {key}")
+                return missing()
+            value = values if is_list else values[0]
+            return _convert_or_error(value, convert, message)
 
         return resolve_form
 
     if isinstance(extractor, File):
         key = extractor.name or param.name
+        item_type = _list_item_type(target_type) if is_list else target_type
 
         async def resolve_file(request: Request, path_params: dict[str, str]) -> Any:
             try:
@@ -220,9 +368,8 @@ def _compile_param(
                 raise HTTPError(400, "Invalid form data") from exc
             files = form.files.get(key)
             if files is None:
-                return _default_or_error(param.name, default, target_type)
-            if _is_list_type(target_type):
-                item_type = _list_item_type(target_type)
+                return missing()
+            if is_list:
                 return [_coerce_file(file, item_type) for file in files]
             return _coerce_file(files[0], target_type)
 
@@ -231,30 +378,37 @@ def _compile_param(
     if isinstance(extractor, Path):
         key = extractor.name or param.name
 
-        async def resolve_path(request: Request, path_params: dict[str, str]) -> Any:
-            if key not in path_params:
-                return _default_or_error(param.name, default, target_type)
-            return _convert_or_error(path_params[key], target_type, f"Invalid path parameter {key}")
+        message = f"Invalid path parameter {key}"
+
+        def resolve_path(request: Request, path_params: dict[str, str]) -> Any:
+            value = path_params.get(key)
+            if value is None:
+                return missing()
+            return _convert_or_error(value, convert, message)
 
         return resolve_path
 
     if isinstance(extractor, Header):
         key = (extractor.name or param.name).lower()
+        raw_key = key.encode("latin-1")
+        message = f"Invalid header {key}"
 
-        async def resolve_header(request: Request, path_params: dict[str, str]) -> Any:
-            if key not in request.headers:
-                return _default_or_error(param.name, default, target_type)
-            return _convert_or_error(request.headers[key], target_type, f"Invalid header {key}")
+        def resolve_header(request: Request, path_params: dict[str, str]) -> Any:
+            value = request.raw_headers.get(raw_key)
+            if value is None:
+                return missing()
+            return _convert_or_error(value.decode("latin-1"), convert, message)
 
         return resolve_header
 
     if isinstance(extractor, State):
         key = extractor.name or param.name
 
-        async def resolve_state(request: Request, path_params: dict[str, str]) -> Any:
-            if key not in request.state:
-                return _default_or_error(param.name, default, target_type)
-            return request.state[key]
+        def resolve_state(request: Request, path_params: dict[str, str]) -> Any:
+            value = request.state.get(key, _MISSING)
+            if value is _MISSING:
+                return missing()
+            return value
 
         return resolve_state
 
@@ -277,12 +431,12 @@ def _compile_type_dependency(
     spec = providers.get(key)
     if spec is None:
         if default is not _MISSING:
-            async def resolve_default(request: Request, path_params: dict[str, str]) -> Any:
+            def resolve_default(request: Request, path_params: dict[str, str]) -> Any:
                 return default
 
             return resolve_default
         if is_optional:
-            async def resolve_none(request: Request, path_params: dict[str, str]) -> Any:
+            def resolve_none(request: Request, path_params: dict[str, str]) -> Any:
                 return None
 
             return resolve_none
@@ -331,23 +485,38 @@ def _compile_dependency(
         if not use_cache:
             value = await compiled_provider(request, path_params)
             return await enter_resource(request.exit_stack, value)
-        if cache_key in request.di_cache:
-            return request.di_cache[cache_key]
+        di_cache = request.di_cache
+        cached = di_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
         value = await compiled_provider(request, path_params)
         resource = await enter_resource(request.exit_stack, value)
-        request.di_cache[cache_key] = resource
+        di_cache[cache_key] = resource
         return resource
 
     return resolve
 
 
-def _default_or_error(name: str, default: Any, target_type: Any) -> Any:
-    is_optional, _ = is_optional_type(target_type)
+def _missing_value(name: str, default: Any, target_type: Any) -> Callable[[], Any]:
     if default is not _MISSING:
-        return default
+
+        def use_default() -> Any:
+            return default
+
+        return use_default
+    is_optional, _ = is_optional_type(target_type)
     if is_optional:
-        return None
-    raise HTTPError(422, f"Missing required value for {name}")
+        return _none
+    message = f"Missing required value for {name}"
+
+    def require() -> Any:
+        raise HTTPError(422, message)
+
+    return require
+
+
+def _none() -> None:
+    return None
 
 
 def _is_request_data_type(annotation: Any) -> bool:
@@ -379,7 +548,7 @@ def _coerce_file(upload: UploadFile, target_type: Any) -> Any:
         return upload.content
     if target_type is str:
         return upload.text()
-    return _convert_or_error(upload.content, target_type, "Invalid file payload")
+    return _convert_or_error(upload.content, value_converter(target_type), "Invalid file payload")
 
 
 def _flatten_fields(fields: dict[str, list[str]]) -> dict[str, Any]:
@@ -392,8 +561,8 @@ def _flatten_fields(fields: dict[str, list[str]]) -> dict[str, Any]:
     return flattened
 
 
-def _convert_or_error(value: Any, target_type: Any, message: str) -> Any:
+def _convert_or_error(value: Any, convert: Callable[[Any], Any], message: str) -> Any:
     try:
-        return convert_value(value, target_type)
+        return convert(value)
     except Exception as exc:
         raise HTTPError(422, message) from exc
@@ -1,21 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
-from urllib.parse import parse_qs
 
 from contextlib import AsyncExitStack
 
-from .form import FormData, parse_form
+from .di import ResourceBag
+from .form import FormData, MultipartParser, is_form_content_type, multipart_boundary, parse_form
+from .utils import parse_query_string
+
+
+_BODYLESS_FORM_METHODS = frozenset(("GET", "HEAD"))
 
 
 class Request:
+    __slots__ = (
+        "scope",
+        "_receive",
+        "state",
+        "exit_stack",
+        "di_cache",
+        "_body",
+        "_body_chunks",
+        "_stream_consumed",
+        "_raw_headers",
+        "_headers",
+        "_query_params",
+        "_form",
+        "_form_parsed",
+        "__dict__",
+    )
+
     def __init__(
         self,
         scope: dict[str, Any],
         receive,
         state: dict[str, Any],
         *,
-        exit_stack: AsyncExitStack | None = None,
+        exit_stack: ResourceBag | AsyncExitStack | None = None,
     ):
         self.scope = scope
         self._receive = receive
@@ -23,6 +45,9 @@ class Request:
         self.exit_stack = exit_stack
         self.di_cache: dict[object, Any] = {}
         self._body: bytes | None = None
+        self._body_chunks: list[bytes] | None = None
+        self._stream_consumed = False
+        self._raw_headers: dict[bytes, bytes] | None = None
         self._headers: dict[str, str] | None = None
         self._query_params: dict[str, list[str]] | None = None
         self._form: FormData | None = None
@@ -36,26 +61,66 @@ class Request:
     def path(self) -> str:
         return self.scope.get("path", "")
 
+    @property
+    def raw_headers(self) -> dict[bytes, bytes]:
+        if self._raw_headers is None:
+            self._raw_headers = {key.lower(): value for key, value in self.scope.get("headers", [])}
+        return self._raw_headers
+
     @property
     def headers(self) -> dict[str, str]:
         if self._headers is None:
-            headers: dict[str, str] = {}
-            for key, value in self.scope.get("headers", []):
-                headers[key.decode("latin-1").lower()] = value.decode("latin-1")
-            self._headers = headers
+            if self._raw_headers is None:
+                self._headers = {
+                    key.lower().decode("latin-1"): value.decode("latin-1")
+                    for key, value in self.scope.get("headers", [])
+                }
+            else:
+                self._headers = {
+                    key.decode("latin-1"): value.decode("latin-1") for key, value in self._raw_headers.items()
+                }
         return self._headers
 
     @property
     def query_params(self) -> dict[str, list[str]]:
         if self._query_params is None:
-            raw = self.scope.get("query_string", b"")
-            parsed = parse_qs(raw.decode("latin-1"), keep_blank_values=True)
-            self._query_params = parsed
+            self._query_params = parse_query_string(self.scope.get("query_string", b""))
         return self._query_params
 
+    async def stream(self) -> AsyncIterator[bytes]:
+        if self._body is not None:
+            if self._body:
+                yield self._body
+            return
+        if self._body_chunks is not None:
+            for chunk in self._body_chunks:
+                yield chunk
+            return
+        if self._stream_consumed:
+            raise RuntimeError("Request body stream has already been consumed")
+        self._stream_consumed = True
+        while True:
+            message = await self._receive()
+            message_type = message.get("type")
+            if message_type == "http.disconnect":
+                return
+            if message_type != "http.request":
+                continue
+            chunk = message.get("body", b"")
+            if chunk:
+                yield chunk
+            if not message.get("more_body", False):
+                return
+
     async def body(self) -> bytes:
         if self._body is not None:
             return self._body
+        if self._body_chunks is not None:
+            self._body = b"".join(self._body_chunks)
+            self._body_chunks = None
+            return self._body
+        if self._stream_consumed:
+            raise RuntimeError("Request body stream has already been consumed")
         chunks: list[bytes] = []
         while True:
             message = await self._receive()
@@ -65,10 +130,14 @@ class Request:
             if message_type != "http.request":
                 continue
             chunk = message.get("body", b"")
-            if chunk:
-                chunks.append(chunk)
             if not message.get("more_body", False):
+                if not chunks:
+                    self._body = chunk
+                    return chunk
+                chunks.append(chunk)
                 break
+            if chunk:
+                chunks.append(chunk)
         self._body = b"".join(chunks)
         return self._body
 
@@ -76,10 +145,26 @@ class Request:
         if self._form_parsed:
             return self._form or FormData()
         content_type = self.headers.get("content-type", "")
-        body = await self.body()
-        if not content_type:
+        if (
+            self.method in _BODYLESS_FORM_METHODS
+            or self.raw_headers.get(b"content-length") == b"0"
+            or not is_form_content_type(content_type)
+        ):
             self._form = FormData()
-        else:
-            self._form = parse_form(body, content_type)
+            self._form_parsed = True
+            return self._form
+        boundary = multipart_boundary(content_type)
+        if boundary is not None and self._body is None:
+            parser = MultipartParser(boundary)
+            chunks: list[bytes] = []
+            async for chunk in self.stream():
+                parser.feed(chunk)
+                chunks.append(chunk)
+            self._body_chunks = chunks
+            self._form = parser.finish()
+            self._form_parsed = True
+            return self._form
+        body = await self.body()
+        self._form = parse_form(body, content_type)
         self._form_parsed = True
         return self._form
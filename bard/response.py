@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterable, Iterable
+from collections.abc import AsyncIterable, Callable, Iterable
 from typing import Any
 
 from .utils import encode_json
 
 
+_START_MESSAGE: dict[str, Any] = {"type": "http.response.start", "status": 200, "headers": []}
+_BODY_MESSAGE: dict[str, Any] = {"type": "http.response.body", "body": b""}
+_CHUNK_MESSAGE: dict[str, Any] = {"type": "http.response.body", "body": b"", "more_body": True}
+_END_MESSAGE: dict[str, Any] = {"type": "http.response.body", "body": b"", "more_body": False}
+
+
 class Response:
+    __slots__ = ("status", "body", "headers")
+
     def __init__(
         self,
         body: bytes,
@@ -21,16 +29,22 @@ class Response:
             self._ensure_content_type(media_type)
 
     def _ensure_content_type(self, media_type: str) -> None:
-        lowered = [key.lower() for key, _ in self.headers]
-        if b"content-type" not in lowered:
+        if not _has_content_type(self.headers):
             self.headers.append((b"content-type", media_type.encode("latin-1")))
 
     async def __call__(self, send) -> None:
-        await send({"type": "http.response.start", "status": self.status, "headers": self.headers})
-        await send({"type": "http.response.body", "body": self.body})
+        start = _START_MESSAGE.copy()
+        start["status"] = self.status
+        start["headers"] = self.headers
+        await send(start)
+        message = _BODY_MESSAGE.copy()
+        message["body"] = self.body
+        await send(message)
 
 
 class StreamingResponse:
+    __slots__ = ("status", "body", "headers", "media_type")
+
     def __init__(
         self,
         body: AsyncIterable[bytes | str] | Iterable[bytes | str],
@@ -46,52 +60,110 @@ class StreamingResponse:
             self._ensure_content_type(media_type)
 
     def _ensure_content_type(self, media_type: str) -> None:
-        lowered = [key.lower() for key, _ in self.headers]
-        if b"content-type" not in lowered:
+        if not _has_content_type(self.headers):
             self.headers.append((b"content-type", media_type.encode("latin-1")))
 
     async def __call__(self, send) -> None:
-        await send({"type": "http.response.start", "status": self.status, "headers": self.headers})
+        start = _START_MESSAGE.copy()
+        start["status"] = self.status
+        start["headers"] = self.headers
+        await send(start)
+        if isinstance(self.body, (list, tuple)):
+            message = _BODY_MESSAGE.copy()
+            message["body"] = b"".join(
+                chunk if type(chunk) is bytes else _coerce_chunk(chunk) for chunk in self.body
+            )
+            await send(message)
+            return
         if _is_async_iterable(self.body):
             async for chunk in self.body:
-                await send({"type": "http.response.body", "body": _coerce_chunk(chunk), "more_body": True})
+                message = _CHUNK_MESSAGE.copy()
+                message["body"] = chunk if type(chunk) is bytes else _coerce_chunk(chunk)
+                await send(message)
         else:
             for chunk in self.body:
-                await send({"type": "http.response.body", "body": _coerce_chunk(chunk), "more_body": True})
-        await send({"type": "http.response.body", "body": b"", "more_body": False})
+                message = _CHUNK_MESSAGE.copy()
+                message["body"] = chunk if type(chunk) is bytes else _coerce_chunk(chunk)
+                await send(message)
+        await send(_END_MESSAGE.copy())
 
 
 def to_response(result: Any) -> Response | StreamingResponse:
+    render = _RENDERERS.get(type(result))
+    if render is not None:
+        return render(result, 200, None)
     if isinstance(result, (Response, StreamingResponse)):
         return result
-
-    status = 200
-    headers = None
-
     if isinstance(result, tuple):
-        if len(result) == 2:
-            result, status = result
-        elif len(result) == 3:
-            result, status, headers = result
-        else:
-            raise ValueError("Response tuple must be (body, status) or (body, status, headers)")
+        return _render_tuple(result, 200, None)
+    return _render_value(result, 200, None)
 
-    if isinstance(result, StreamingResponse):
-        if status == 200 and headers is None:
-            return result
-        return StreamingResponse(result.body, status=status, headers=headers, media_type=result.media_type)
 
-    if result is None:
-        return Response(b"", status=204, media_type=None, headers=headers)
+def _render_value(result: Any, status: int, headers: Any) -> Response | StreamingResponse:
+    render = _VALUE_RENDERERS.get(type(result))
+    if render is not None:
+        return render(result, status, headers)
+    if isinstance(result, StreamingResponse):
+        return _render_stream(result, status, headers)
     if isinstance(result, bytes):
-        return Response(result, status=status, media_type="application/octet-stream", headers=headers)
+        return _render_bytes(result, status, headers)
     if isinstance(result, str):
-        return Response(result.encode("utf-8"), status=status, headers=headers)
+        return _render_str(result, status, headers)
     if _is_async_iterable(result) or _is_iterable_stream(result):
         return StreamingResponse(result, status=status, headers=headers)
+    return _render_json(result, status, headers)
+
+
+def _render_tuple(result: tuple, status: int, headers: Any) -> Response | StreamingResponse:
+    if len(result) == 2:
+        result, status = result
+    elif len(result) == 3:
+        result, status, headers = result
+    else:
+        raise ValueError("Response tuple must be (body, status) or (body, status, headers)")
+    return _render_value(result, status, headers)
+
+
+def _render_stream(result: StreamingResponse, status: int, headers: Any) -> StreamingResponse:
+    if status == 200 and headers is None:
+        return result
+    return StreamingResponse(result.body, status=status, headers=headers, media_type=result.media_type)
 
-    body = encode_json(result)
-    return Response(body, status=status, media_type="application/json", headers=headers)
+
+def _render_none(result: None, status: int, headers: Any) -> Response:
+    return Response(b"", status=204, media_type=None, headers=headers)
+
+
+def _render_bytes(result: bytes, status: int, headers: Any) -> Response:
+    return Response(result, status=status, media_type="application/octet-stream", headers=headers)
+
+
+def _render_str(result: str, status: int, headers: Any) -> Response:
+    return Response(result.encode("utf-8"), status=status, headers=headers)
+
+
+def _render_json(result: Any, status: int, headers: Any) -> Response:
+    return Response(encode_json(result), status=status, media_type="application/json", headers=headers)
+
+
+def _render_identity(result: Response, status: int, headers: Any) -> Response:
+    return result
+
+
+_VALUE_RENDERERS: dict[type, Callable[[Any, int, Any], Response | StreamingResponse]] = {
+    type(None): _render_none,
+    bytes: _render_bytes,
+    str: _render_str,
+    dict: _render_json,
+    list: _render_json,
+    StreamingResponse: _render_stream,
+}
+
+_RENDERERS: dict[type, Callable[[Any, int, Any], Response | StreamingResponse]] = {
+    **_VALUE_RENDERERS,
+    Response: _render_identity,
+    tuple: _render_tuple,
+}
 
 
 def _normalize_headers(
@@ -101,6 +173,9 @@ def _normalize_headers(
         return []
     if isinstance(headers, dict):
         return [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()]
+    if isinstance(headers, list):
+        if all(type(key) is bytes and type(value) is bytes for key, value in headers):
+            return list(headers)
     normalized: list[tuple[bytes, bytes]] = []
     for key, value in headers:
         if isinstance(key, str):
@@ -111,6 +186,13 @@ def _normalize_headers(
     return normalized
 
 
+def _has_content_type(headers: list[tuple[bytes, bytes]]) -> bool:
+    for key, _ in headers:
+        if key == b"content-type" or key.lower() == b"content-type":
+            return True
+    return False
+
+
 def _is_async_iterable(value: Any) -> bool:
     return hasattr(value, "__aiter__")
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import inspect
+import sys
 from typing import Callable, Any
 
 from .handler import CompiledHandler, MissingProviderError, compile_handler
@@ -10,7 +11,17 @@ from .request import Request
 from .websocket import WebSocket
 
 
-@dataclass
+_MATCH_CACHE_SIZE = 1024
+_NOT_CACHED = object()
+_NO_PARAMS: dict[str, str] = {}
+
+_METHOD_KEYS: dict[str, str] = {
+    method: sys.intern(method)
+    for method in ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "WEBSOCKET")
+}
+
+
+@dataclass(slots=True)
 class _Node:
     static_children: dict[str, "_Node"]
     param_child: "_Node | None"
@@ -59,6 +70,8 @@ class Router:
         self._compiled_once = False
         self._http_middlewares: list[Callable] = []
         self._ws_middlewares: list[Callable] = []
+        self._match_cache: dict[tuple[str, str], _RoutedHandler | None] = {}
+        self._static_nodes: dict[str, _Node] = {}
 
     def provide(self, key: object, provider: Callable[..., Any], *, use_cache: bool = True) -> None:
         caller_locals = _get_callsite_locals()
@@ -102,9 +115,11 @@ class Router:
     ) -> None:
         if not path.startswith("/"):
             raise ValueError("Route path must start with '/'")
+        self._match_cache.clear()
         node = self._root
         param_names: list[str] = []
-        for segment in _split_path(path):
+        segments = _split_path(path)
+        for segment in segments:
             if _is_param(segment):
                 name = segment[1:-1]
                 param_names.append(name)
@@ -113,6 +128,8 @@ class Router:
                 node = node.param_child
             else:
                 node = node.static_children.setdefault(segment, _Node())
+        if not param_names:
+            self._static_nodes["/" + "/".join(segments)] = node
         caller_locals = _get_callsite_locals()
         self._handler_localns.setdefault(handler, caller_locals)
         methods_tuple = tuple(methods)
@@ -130,7 +147,7 @@ class Router:
                 raise
             compiled = None
         for method in methods:
-            method_key = method.upper()
+            method_key = _method_key(method)
             if method_key in node.handlers:
                 raise ValueError(f"Route already registered for {method_key} {path}")
             node.handlers[method_key] = handler
@@ -162,6 +179,7 @@ class Router:
 
     def compile(self) -> None:
         self._compiled_once = True
+        self._match_cache.clear()
         for node, method in self._routes:
             handler = node.handlers[method]
             compiled = self._compile_handler_cached(handler)
@@ -174,24 +192,48 @@ class Router:
             )
 
     def match(self, method: str, path: str) -> tuple[_RoutedHandler | None, dict[str, str]]:
+        routed, params = self._match(method, path)
+        if params is _NO_PARAMS:
+            return routed, {}
+        return routed, params
+
+    def _match(self, method: str, path: str) -> tuple[_RoutedHandler | None, dict[str, str]]:
+        node = self._static_nodes.get(path)
+        if node is not None:
+            routed, _ = _resolve_method(node, method)
+            return routed, _NO_PARAMS
+        cache_key = (method, path)
+        cached = self._match_cache.get(cache_key, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached, _NO_PARAMS  # type: ignore[return-value]
         node = self._root
         param_values: list[str] = []
         for segment in _split_path(path):
-            if segment in node.static_children:
-                node = node.static_children[segment]
+            child = node.static_children.get(segment)
+            if child is not None:
+                node = child
                 continue
-            if node.param_child is None:
-                return None, {}
+            child = node.param_child
+            if child is None:
+                self._cache_match(cache_key, None)
+                return None, _NO_PARAMS
             param_values.append(segment)
-            node = node.param_child
-        method = method.upper()
-        routed = node.routed.get(method)
-        param_names = node.param_names.get(method, [])
-        if routed is None and method == "HEAD":
-            routed = node.routed.get("GET")
-            param_names = node.param_names.get("GET", [])
-        params = {name: value for name, value in zip(param_names, param_values)}
-        return routed, params
+            node = child
+        routed, param_names = _resolve_method(node, method)
+        if not param_values:
+            self._cache_match(cache_key, routed)
+            return routed, _NO_PARAMS
+        if routed is None:
+            return None, _NO_PARAMS
+        if len(param_values) == 1:
+            return routed, {param_names[0]: param_values[0]}
+        return routed, dict(zip(param_names, param_values))
+
+    def _cache_match(self, key: tuple[str, str], routed: _RoutedHandler | None) -> None:
+        cache = self._match_cache
+        if len(cache) >= _MATCH_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = routed
 
     def _compile_handler_cached(
         self,
@@ -215,11 +257,26 @@ class Router:
         return compiled
 
 
+def _resolve_method(node: _Node, method: str) -> tuple[_RoutedHandler | None, list[str]]:
+    method = _METHOD_KEYS.get(method) or method.upper()
+    routed = node.routed.get(method)
+    if routed is None and method == "HEAD":
+        return node.routed.get("GET"), node.param_names.get("GET", [])
+    return routed, node.param_names.get(method, [])
+
+
+def _method_key(method: str) -> str:
+    upper = method.upper()
+    return _METHOD_KEYS.get(upper) or sys.intern(upper)
+
+
 def _split_path(path: str) -> list[str]:
     trimmed = path.strip("/")
     if not trimmed:
         return []
-    return [segment for segment in trimmed.split("/") if segment]
+    if "//" in trimmed:
+        return [segment for segment in trimmed.split("/") if segment]
+    return trimmed.split("/")
 
 
 def _is_param(segment: str) -> bool:
@@ -242,6 +299,10 @@ def _get_callsite_locals() -> dict[str, object]:
         frame = frame.f_back
         while frame and frame.f_code.co_filename == __file__:
             frame = frame.f_back
-        return dict(frame.f_locals) if frame else {}
+        if frame is None:
+            return {}
+        if not frame.f_code.co_flags & inspect.CO_OPTIMIZED:
+            return frame.f_locals
+        return dict(frame.f_locals)
     finally:
         del frame
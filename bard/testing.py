@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import sys
+import weakref
+from collections.abc import Awaitable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urlsplit
 
 from .utils import decode_json, encode_json
 
 
+_HTTP_SCOPE: dict[str, Any] = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1"}
+_JSON_HEADERS: dict[str, str] = {"content-type": "application/json"}
+_EMPTY_REQUEST: Mapping[str, Any] = MappingProxyType({"type": "http.request", "body": b"", "more_body": False})
+
+
 @dataclass
 class TestResponse:
     status: int
@@ -25,6 +35,8 @@ class TestClient:
         self.app = app
         self._loop = None
         self._previous_loop = None
+        self._idle_loop: asyncio.AbstractEventLoop | None = None
+        self._close_idle_loop: weakref.finalize | None = None
 
     def __enter__(self):
         self._loop = asyncio.new_event_loop()
@@ -60,11 +72,29 @@ class TestClient:
             raise ValueError("Provide json or body, not both")
         if json is not None:
             body = encode_json(json)
-            headers = headers or {}
-            headers.setdefault("content-type", "application/json")
-        if self._loop is None:
-            return asyncio.run(self._request_async(method, path, headers=headers, body=body))
-        return self._loop.run_until_complete(self._request_async(method, path, headers=headers, body=body))
+            headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
+        request = self._request_async(method, path, headers=headers, body=body)
+        if self._loop is not None:
+            return self._loop.run_until_complete(request)
+        return _run_isolated(self._get_idle_loop(), request)
+
+    def close(self) -> None:
+        if self._close_idle_loop is not None:
+            self._close_idle_loop()
+        self._idle_loop = None
+        self._close_idle_loop = None
+
+    def _get_idle_loop(self) -> asyncio.AbstractEventLoop:
+        if self._idle_loop is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                raise RuntimeError("TestClient cannot run inside an active event loop")
+            self._idle_loop = asyncio.new_event_loop()
+            self._close_idle_loop = weakref.finalize(self, self._idle_loop.close)
+        return self._idle_loop
 
     def get(self, path: str, **kwargs) -> TestResponse:
         return self.request("GET", path, **kwargs)
@@ -87,43 +117,68 @@ class TestClient:
         body: bytes | None,
     ) -> TestResponse:
         parsed = urlsplit(path)
-        headers = headers or {}
-        headers_list = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
-        scope = {
-            "type": "http",
-            "asgi": {"version": "3.0"},
-            "method": method.upper(),
-            "path": parsed.path or "/",
-            "query_string": parsed.query.encode("latin-1"),
-            "headers": headers_list,
-            "http_version": "1.1",
-        }
-        body_bytes = body or b""
-        body_sent = False
-        messages = []
+        headers_list = [_encode_header(k, v) for k, v in headers.items()] if headers else ()
+        scope = _HTTP_SCOPE.copy()
+        scope["method"] = method.upper()
+        scope["path"] = parsed.path or "/"
+        scope["query_string"] = parsed.query.encode("latin-1")
+        scope["headers"] = headers_list
+        pending = [{"type": "http.request", "body": body or b"", "more_body": False}]
+        status = 500
+        resp_headers: dict[str, str] = {}
+        body_parts: list[bytes] = []
 
         async def receive():
-            nonlocal body_sent
-            if body_sent:
-                await asyncio.sleep(0)
-                return {"type": "http.request", "body": b"", "more_body": False}
-            body_sent = True
-            return {"type": "http.request", "body": body_bytes, "more_body": False}
+            if pending:
+                return pending.pop()
+            await asyncio.sleep(0)
+            return _EMPTY_REQUEST
 
         async def send(message):
-            messages.append(message)
+            nonlocal status, resp_headers
+            message_type = message["type"]
+            if message_type == "http.response.body":
+                chunk = message.get("body", b"")
+                if chunk:
+                    body_parts.append(chunk)
+            elif message_type == "http.response.start":
+                status = message["status"]
+                resp_headers = {
+                    key.decode("latin-1"): value.decode("latin-1") for key, value in message.get("headers", [])
+                }
 
         await self.app(scope, receive, send)
 
-        status = 500
-        resp_headers: dict[str, str] = {}
-        body_parts: list[bytes] = []
-        for message in messages:
-            if message["type"] == "http.response.start":
-                status = message["status"]
-                for key, value in message.get("headers", []):
-                    resp_headers[key.decode("latin-1")] = value.decode("latin-1")
-            elif message["type"] == "http.response.body":
-                body_parts.append(message.get("body", b""))
-
         return TestResponse(status=status, headers=resp_headers, body=b"".join(body_parts))
+
+
+@lru_cache(maxsize=512)
+def _encode_header(key: str, value: str) -> tuple[bytes, bytes]:
+    return key.lower().encode("latin-1"), value.encode("latin-1")
+
+
+def _run_isolated(loop: asyncio.AbstractEventLoop, request: Awaitable[TestResponse]) -> TestResponse:
+    agens: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    async def run() -> TestResponse:
+        firstiter, finalizer = sys.get_asyncgen_hooks()
+
+        def track(agen: Any) -> None:
+            agens.add(agen)
+            if firstiter is not None:
+                firstiter(agen)
+
+        sys.set_asyncgen_hooks(firstiter=track, finalizer=finalizer)
+        return await request
+
+    async def teardown() -> None:
+        tasks = asyncio.all_tasks(loop) - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*(agen.aclose() for agen in list(agens)), return_exceptions=True)
+
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.run_until_complete(teardown())
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
-from dataclasses import is_dataclass
+import inspect
+from collections.abc import Callable
 from enum import Enum
-from types import UnionType
+from functools import lru_cache
+from types import CoroutineType, UnionType
 from typing import Any, Union, get_args, get_origin
+from urllib.parse import unquote
 
 import msgspec
 
+_NON_AWAITABLE_TYPES = frozenset({bool, int, float, str, bytes, dict, list, tuple})
+_ENCODER = msgspec.json.Encoder()
+_ANY_DECODER = msgspec.json.Decoder()
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "0", "no", "off"))
+
 
 def is_optional_type(annotation: Any) -> tuple[bool, Any]:
+    try:
+        return _cached_optional_type(_annotation_key(annotation), annotation)
+    except TypeError:
+        return _optional_type(annotation)
+
+
+@lru_cache(maxsize=1024)
+def _cached_optional_type(key: Any, annotation: Any) -> tuple[bool, Any]:
+    return _optional_type(annotation)
+
+
+def _annotation_key(target_type: Any) -> Any:
+    args = get_args(target_type)
+    if args:
+        return (target_type, get_origin(target_type), tuple(_annotation_key(arg) for arg in args))
+    if isinstance(target_type, type):
+        return target_type
+    return (type(target_type), target_type)
+
+
+def _optional_type(annotation: Any) -> tuple[bool, Any]:
     if annotation is type(None):
         return True, type(None)
     origin = get_origin(annotation)
@@ -20,57 +50,160 @@ def is_optional_type(annotation: Any) -> tuple[bool, Any]:
     return False, annotation
 
 
+def is_awaitable(value: Any) -> bool:
+    if type(value) is CoroutineType:
+        return True
+    if value is None or type(value) in _NON_AWAITABLE_TYPES:
+        return False
+    return inspect.isawaitable(value)
+
+
+def parse_query_string(raw: bytes) -> dict[str, list[str]]:
+    params: dict[str, list[str]] = {}
+    if not raw:
+        return params
+    for pair in raw.decode("latin-1").split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        if "+" in pair:
+            key = key.replace("+", " ")
+            value = value.replace("+", " ")
+        if "%" in pair:
+            key = unquote(key)
+            value = unquote(value)
+        values = params.get(key)
+        if values is None:
+            params[key] = [value]
+        else:
+            values.append(value)
+    return params
+
+
 def convert_value(value: Any, target_type: Any) -> Any:
-    if target_type is Any:
+    if type(value) is target_type:
         return value
+    return value_converter(target_type)(value)
+
+
+def decode_json(body: bytes, target_type: Any) -> Any:
+    if target_type is Any:
+        return _ANY_DECODER.decode(body)
+    if hasattr(target_type, "model_validate_json"):
+        return target_type.model_validate_json(body)
+    return _json_decoder_for(target_type).decode(body)
+
+
+def json_decoder(target_type: Any) -> Callable[[bytes], Any]:
+    if target_type is Any:
+        return _ANY_DECODER.decode
+    if hasattr(target_type, "model_validate_json"):
+        if getattr(target_type, "__pydantic_complete__", False):
+            return target_type.__pydantic_validator__.validate_json
+        return target_type.model_validate_json
+    try:
+        return _json_decoder_for(target_type).decode
+    except Exception:
+
+        def decode(body: bytes) -> Any:
+            return decode_json(body, target_type)
+
+        return decode
+
+
+def encode_json(data: Any) -> bytes:
+    try:
+        return _ENCODER.encode(data)
+    except TypeError:
+        if not hasattr(data, "model_dump"):
+            raise
+    return _ENCODER.encode(data.model_dump(mode="json"))
+
+
+@lru_cache(maxsize=256)
+def _json_decoder_for(target_type: Any) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(target_type)
+
+
+def value_converter(target_type: Any) -> Callable[[Any], Any]:
+    try:
+        return _cached_converter(_annotation_key(target_type), target_type)
+    except TypeError:
+        return _build_converter(target_type)
+
+
+@lru_cache(maxsize=1024)
+def _cached_converter(key: Any, target_type: Any) -> Callable[[Any], Any]:
+    return _build_converter(target_type)
+
+
+def _build_converter(target_type: Any) -> Callable[[Any], Any]:
+    if target_type is Any:
+        return _identity
     is_optional, inner_type = is_optional_type(target_type)
-    if is_optional and value is None:
-        return None
-    target_type = inner_type
+    if is_optional:
+        convert = value_converter(inner_type)
+
+        def convert_optional(value: Any) -> Any:
+            if value is None:
+                return None
+            return convert(value)
+
+        return convert_optional
 
     origin = get_origin(target_type)
     args = get_args(target_type)
 
-    if target_type is list:
-        return _convert_list(value, ())
-    if target_type is dict:
-        return _convert_dict(value)
+    if target_type is list or origin is list:
+        convert_item = value_converter(args[0] if args else Any)
+
+        def convert_list(value: Any) -> list[Any]:
+            if value is None:
+                return []
+            if isinstance(value, list):
+                return [convert_item(item) for item in value]
+            return [convert_item(value)]
 
-    if origin is list:
-        return _convert_list(value, args)
+        return convert_list
 
-    if origin is dict:
-        return _convert_dict(value)
+    if target_type is dict or origin is dict:
+        return _convert_dict
 
     if origin in (Union, UnionType):
-        return _convert_union(value, args)
+        return _union_converter(args)
 
-    return _convert_scalar(value, target_type)
+    return _scalar_converter(target_type)
 
 
-def decode_json(body: bytes, target_type: Any) -> Any:
-    if target_type is Any:
-        return msgspec.json.decode(body)
-    if hasattr(target_type, "model_validate_json"):
-        return target_type.model_validate_json(body)
-    if is_dataclass(target_type):
-        return msgspec.json.decode(body, type=target_type)
-    return msgspec.json.decode(body, type=target_type)
+def _scalar_converter(target_type: Any) -> Callable[[Any], Any]:
+    converter = _SCALAR_CONVERTERS.get(target_type)
+    if converter is not None:
+        return converter
+    if isinstance(target_type, type) and issubclass(target_type, Enum):
+        return target_type
 
+    def convert_scalar(value: Any) -> Any:
+        if isinstance(value, target_type):
+            return value
+        return target_type(value)
 
-def encode_json(data: Any) -> bytes:
-    if hasattr(data, "model_dump"):
-        data = data.model_dump(mode="json")
-    return msgspec.json.encode(data)
+    return convert_scalar
 
 
-def _convert_list(value: Any, args: tuple[Any, ...]) -> list[Any]:
-    item_type = args[0] if args else Any
-    if value is None:
-        return []
-    if isinstance(value, list):
-        return [convert_value(item, item_type) for item in value]
-    return [convert_value(value, item_type)]
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _convert_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
+def _convert_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
 
 
 def _convert_dict(value: Any) -> dict[Any, Any]:
@@ -81,41 +214,25 @@ def _convert_dict(value: Any) -> dict[Any, Any]:
     raise ValueError("Expected dict value")
 
 
-def _convert_union(value: Any, args: tuple[Any, ...]) -> Any:
-    last_error: Exception | None = None
-    for arg in args:
-        if arg is type(None):
-            if value is None:
-                return None
-            continue
-        try:
-            return convert_value(value, arg)
-        except Exception as exc:
-            last_error = exc
-            continue
-    if last_error is not None:
-        raise last_error
-    return value
-
+def _union_converter(args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    none_type = type(None)
+    has_none = none_type in args
+    members = tuple(value_converter(arg) for arg in args if arg is not none_type)
 
-def _convert_scalar(value: Any, target_type: Any) -> Any:
-    if target_type is str:
-        return "" if value is None else str(value)
-    if target_type is int:
-        return int(value)
-    if target_type is float:
-        return float(value)
-    if target_type is bool:
-        return _coerce_bool(value)
-    if target_type is bytes:
-        if isinstance(value, bytes):
-            return value
-        return str(value).encode("utf-8")
-    if isinstance(target_type, type) and issubclass(target_type, Enum):
-        return target_type(value)
-    if isinstance(value, target_type):
+    def convert_union(value: Any) -> Any:
+        if value is None and has_none:
+            return None
+        last_error: Exception | None = None
+        for convert in members:
+            try:
+                return convert(value)
+            except Exception as exc:
+                last_error = exc
+        if last_error is not None:
+            raise last_error
         return value
-    return target_type(value)
+
+    return convert_union
 
 
 def _coerce_bool(value: Any) -> bool:
@@ -123,8 +240,17 @@ def _coerce_bool(value: Any) -> bool:
         return value
     if isinstance(value, str):
         lowered = value.lower()
-        if lowered in ("true", "1", "yes", "on"):
+        if lowered in _TRUE_STRINGS:
             return True
-        if lowered in ("false", "0", "no", "off"):
+        if lowered in _FALSE_STRINGS:
             return False
     return bool(value)
+
+
+_SCALAR_CONVERTERS: dict[Any, Callable[[Any], Any]] = {
+    str: _convert_str,
+    int: int,
+    float: float,
+    bool: _coerce_bool,
+    bytes: _convert_bytes,
+}
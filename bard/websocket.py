@@ -2,10 +2,27 @@ from __future__ import annotations
 
 from contextlib import AsyncExitStack
 from typing import Any
-from urllib.parse import parse_qs
+
+from .di import ResourceBag
+from .utils import parse_query_string
 
 
 class WebSocket:
+    __slots__ = (
+        "scope",
+        "_receive",
+        "_send",
+        "state",
+        "exit_stack",
+        "_di_cache",
+        "_raw_headers",
+        "_headers",
+        "_query_params",
+        "_accepted",
+        "_closed",
+        "__dict__",
+    )
+
     def __init__(
         self,
         scope: dict[str, Any],
@@ -13,38 +30,54 @@ class WebSocket:
         send,
         state: dict[str, Any],
         *,
-        exit_stack: AsyncExitStack | None = None,
+        exit_stack: ResourceBag | AsyncExitStack | None = None,
     ) -> None:
         self.scope = scope
         self._receive = receive
         self._send = send
         self.state = state
         self.exit_stack = exit_stack
-        self.di_cache: dict[object, Any] = {}
+        self._di_cache: dict[object, Any] | None = None
+        self._raw_headers: dict[bytes, bytes] | None = None
         self._headers: dict[str, str] | None = None
         self._query_params: dict[str, list[str]] | None = None
         self._accepted = False
         self._closed = False
 
+    @property
+    def di_cache(self) -> dict[object, Any]:
+        if self._di_cache is None:
+            self._di_cache = {}
+        return self._di_cache
+
     @property
     def path(self) -> str:
         return self.scope.get("path", "")
 
+    @property
+    def raw_headers(self) -> dict[bytes, bytes]:
+        if self._raw_headers is None:
+            self._raw_headers = {key.lower(): value for key, value in self.scope.get("headers", [])}
+        return self._raw_headers
+
     @property
     def headers(self) -> dict[str, str]:
         if self._headers is None:
-            headers: dict[str, str] = {}
-            for key, value in self.scope.get("headers", []):
-                headers[key.decode("latin-1").lower()] = value.decode("latin-1")
-            self._headers = headers
+            if self._raw_headers is None:
+                self._headers = {
+                    key.lower().decode("latin-1"): value.decode("latin-1")
+                    for key, value in self.scope.get("headers", [])
+                }
+            else:
+                self._headers = {
+                    key.decode("latin-1"): value.decode("latin-1") for key, value in self._raw_headers.items()
+                }
         return self._headers
 
     @property
     def query_params(self) -> dict[str, list[str]]:
         if self._query_params is None:
-            raw = self.scope.get("query_string", b"")
-            parsed = parse_qs(raw.decode("latin-1"), keep_blank_values=True)
-            self._query_params = parsed
+            self._query_params = parse_query_string(self.scope.get("query_string", b""))
         return self._query_params
 
     @property
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+from enum import Enum
+
+import pytest
 
 from bard import BardApp, HTTPError, Response, Router, StreamingResponse, TestClient
 
@@ -46,61 +49,73 @@ def test_response_variants():
     assert tuple_resp.headers["x-test"] == "1"
 
 
-def test_response_tuple_status_only():
-    async def accepted():
-        return "ok", 202
-
-    router = Router()
-    router.get("/accepted", accepted)
-    app = BardApp(router)
+def test_response_subclasses_use_base_type_rendering():
+    class Label(str, Enum):
+        READY = "ready"
 
-    with TestClient(app) as client:
-        resp = client.get("/accepted")
+    class Payload(dict):
+        pass
 
-    assert resp.status == 202
-    assert resp.body == b"ok"
+    async def text_subclass():
+        return Label.READY
 
-
-def test_response_custom_content_type_preserved():
-    async def custom():
-        return Response(b"data", headers={"content-type": "application/custom"})
+    async def dict_subclass():
+        return Payload(ok=True), 201
 
     router = Router()
-    router.get("/custom", custom)
+    router.get("/text", text_subclass)
+    router.get("/dict", dict_subclass)
     app = BardApp(router)
 
     with TestClient(app) as client:
-        resp = client.get("/custom")
+        text_resp = client.get("/text")
+        dict_resp = client.get("/dict")
 
-    assert resp.headers["content-type"] == "application/custom"
+    assert text_resp.body == b"ready"
+    assert text_resp.headers["content-type"].startswith("text/plain")
+    assert dict_resp.status == 201
+    assert dict_resp.json() == {"ok": True}
 
 
-def test_response_headers_bytes_roundtrip():
-    async def custom():
-        return Response(b"data", headers=[(b"x-test", b"1")])
+def test_response_tuple_status_only():
+    async def accepted():
+        return "ok", 202
 
     router = Router()
-    router.get("/custom", custom)
+    router.get("/accepted", accepted)
     app = BardApp(router)
 
     with TestClient(app) as client:
-        resp = client.get("/custom")
-
-    assert resp.headers["x-test"] == "1"
+        resp = client.get("/accepted")
 
+    assert resp.status == 202
+    assert resp.body == b"ok"
 
-def test_response_headers_string_pairs():
-    async def custom():
-        return Response(b"data", headers=[("x-test", "1")])
 
+@pytest.fixture(scope="module")
+def header_client():
     router = Router()
-    router.get("/custom", custom)
-    app = BardApp(router)
+    router.get("/content-type", lambda: Response(b"data", headers={"content-type": "application/custom"}))
+    router.get("/bytes-pairs", lambda: Response(b"data", headers=[(b"x-test", b"1")]))
+    router.get("/string-pairs", lambda: Response(b"data", headers=[("x-test", "1")]))
 
-    with TestClient(app) as client:
-        resp = client.get("/custom")
+    with TestClient(BardApp(router)) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("path", "header", "expected"),
+    [
+        ("/content-type", "content-type", "application/custom"),
+        ("/bytes-pairs", "x-test", "1"),
+        ("/string-pairs", "x-test", "1"),
+    ],
+)
+def test_response_headers_preserved(header_client, path, header, expected):
+    resp = header_client.get(path)
 
-    assert resp.headers["x-test"] == "1"
+    assert resp.body == b"data"
+    assert resp.headers[header] == expected
 
 
 def test_method_not_found_returns_404():
@@ -223,3 +238,55 @@ def test_streaming_response_sends_multiple_body_messages():
         resp = client.get("/stream")
 
     assert resp.body == b"ab"
+
+
+def test_streaming_response_sends_distinct_messages():
+    messages = []
+
+    def chunks():
+        yield b"a"
+        yield "b"
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(StreamingResponse(chunks())(send))
+
+    assert [message.get("body") for message in messages[1:]] == [b"a", b"b", b""]
+    assert [message.get("more_body") for message in messages[1:]] == [True, True, False]
+    assert messages[0]["status"] == 200
+
+
+def test_streaming_response_coalesces_materialized_chunks():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(StreamingResponse([b"x", "y"] * 5000)(send))
+
+    assert len(messages) < 10
+    assert b"".join(message.get("body", b"") for message in messages[1:]) == b"xy" * 5000
+    assert messages[-1].get("more_body", False) is False
+
+
+def test_response_copies_encoded_header_list():
+    headers = [(b"x-token", b"abc")]
+
+    first = Response(b"ok", headers=headers)
+    second = Response(b"ok", headers=headers)
+
+    assert headers == [(b"x-token", b"abc")]
+    assert first.headers == second.headers == [
+        (b"x-token", b"abc"),
+        (b"content-type", b"text/plain; charset=utf-8"),
+    ]
+    assert Response(b"ok", headers=[(b"Content-Type", b"text/html")]).headers == [
+        (b"Content-Type", b"text/html")
+    ]
+
+
+def test_response_normalizes_mixed_header_list():
+    response = Response(b"ok", headers=[(b"x-a", b"1"), ("x-b", "2")], media_type=None)
+
+    assert response.headers == [(b"x-a", b"1"), (b"x-b", b"2")]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 from typing import Annotated
 
 import pytest
 
 from bard import BardApp, Depends, HTTPError, Request, Router, TestClient
+from bard.di import ResourceBag, enter_resource
 
 
 def test_type_based_injection_resolves():
@@ -187,12 +188,10 @@ def test_dependency_close_and_close_order_is_lifo():
     router.provide(A, provide_a)
     router.provide(B, provide_b)
     router.get("/r", read)
-    app = BardApp(router)
 
-    with TestClient(app) as client:
-        resp = client.get("/r")
+    result = _call_with_resource_bag(router, "/r")
 
-    assert resp.json()["ok"] is True
+    assert result["ok"] is True
     assert events == ["B.close", "A.close"]
 
 
@@ -212,12 +211,10 @@ def test_dependency_aclose_coroutine_function_runs():
     router = Router()
     router.provide(Resource, provide_resource)
     router.get("/r", read)
-    app = BardApp(router)
 
-    with TestClient(app) as client:
-        resp = client.get("/r")
+    result = _call_with_resource_bag(router, "/r")
 
-    assert resp.json()["ok"] is True
+    assert result["ok"] is True
     assert events == ["aclose"]
 
 
@@ -240,12 +237,10 @@ def test_dependency_aclose_returning_awaitable_runs():
     router = Router()
     router.provide(Resource, provide_resource)
     router.get("/r", read)
-    app = BardApp(router)
 
-    with TestClient(app) as client:
-        resp = client.get("/r")
+    result = _call_with_resource_bag(router, "/r")
 
-    assert resp.json()["ok"] is True
+    assert result["ok"] is True
     assert events == ["aclose"]
 
 
@@ -273,12 +268,10 @@ def test_depends_use_cache_false_creates_multiple_and_cleans_both_lifo():
 
     router = Router()
     router.get("/r", read)
-    app = BardApp(router)
 
-    with TestClient(app) as client:
-        resp = client.get("/r")
+    result = _call_with_resource_bag(router, "/r")
 
-    assert resp.json()["same"] is False
+    assert result["same"] is False
     assert events == ["close:2", "close:1"]
 
 
@@ -431,3 +424,175 @@ def test_missing_type_provider_raises_type_error():
     router.get("/missing", read)
     with pytest.raises(TypeError):
         BardApp(router)
+
+
+def test_resource_bag_runs_mixed_callbacks_lifo_and_continues_after_error():
+    events: list[str] = []
+
+    @contextmanager
+    def sync_cm():
+        try:
+            yield "sync"
+        finally:
+            events.append("sync-exit")
+
+    @asynccontextmanager
+    async def async_cm():
+        try:
+            yield "async"
+        finally:
+            events.append("async-exit")
+
+    def failing() -> None:
+        events.append("failing")
+        raise RuntimeError("boom")
+
+    async def run() -> None:
+        bag = ResourceBag()
+        assert not bag
+        assert bag.enter_context(sync_cm()) == "sync"
+        assert await bag.enter_async_context(async_cm()) == "async"
+        bag.callback(failing)
+        bag.callback(lambda: events.append("plain"))
+        assert bag
+        with pytest.raises(RuntimeError):
+            await bag.aclose()
+        assert not bag
+
+    asyncio.run(run())
+    assert events == ["plain", "failing", "async-exit", "sync-exit"]
+
+
+def test_resource_bag_matches_async_exit_stack_error_handling():
+    def run_with(make_stack):
+        seen: list[str] = []
+
+        class Suppress:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                seen.append(f"suppress:{exc_type.__name__ if exc_type else None}")
+                return True
+
+        @asynccontextmanager
+        async def observer():
+            try:
+                yield
+            except BaseException as exc:
+                seen.append(f"observer:{type(exc).__name__}")
+                raise
+
+        def fail_first() -> None:
+            raise KeyError("first")
+
+        def fail_second() -> None:
+            raise ValueError("second")
+
+        async def run():
+            stack = make_stack()
+            await stack.enter_async_context(observer())
+            stack.enter_context(Suppress())
+            stack.callback(fail_first)
+            stack.callback(fail_second)
+            error = RuntimeError("handler")
+            return await stack.__aexit__(type(error), error, None) if isinstance(
+                stack, AsyncExitStack
+            ) else await stack.aclose(type(error), error, None)
+
+        suppressed = asyncio.run(run())
+        return suppressed, seen
+
+    assert run_with(ResourceBag) == run_with(AsyncExitStack) == (True, ["suppress:KeyError"])
+
+
+def test_resource_bag_chains_cleanup_errors():
+    def fail(message: str):
+        def callback() -> None:
+            raise RuntimeError(message)
+
+        return callback
+
+    async def run():
+        bag = ResourceBag()
+        bag.callback(fail("first"))
+        bag.callback(fail("second"))
+        await bag.aclose()
+
+    with pytest.raises(RuntimeError, match="first") as info:
+        asyncio.run(run())
+
+    assert str(info.value.__context__) == "second"
+
+
+def test_dependency_sees_propagating_cancellation():
+    class Session:
+        pass
+
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def provide_session():
+        try:
+            yield Session()
+        except BaseException as exc:
+            events.append(f"rollback:{type(exc).__name__}")
+            raise
+
+    async def slow(session: Session):
+        await asyncio.sleep(10)
+
+    router = Router()
+    router.provide(Session, provide_session)
+    router.get("/slow", slow)
+    app = BardApp(router)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def run():
+        scope = {"type": "http", "method": "GET", "path": "/slow", "headers": [], "query_string": b""}
+        task = asyncio.create_task(app(scope, receive, send))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert events == ["rollback:CancelledError"]
+
+
+def test_enter_resource_skips_plain_values():
+    bag = ResourceBag()
+    values = [None, 1, "token", {"a": 1}, [1], (1,)]
+
+    results = [asyncio.run(enter_resource(bag, value)) for value in values]
+
+    assert results == values
+    assert not bag
+
+
+def _call_with_resource_bag(router: Router, path: str):
+    handler, params = router.match("GET", path)
+    assert handler is not None
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def run():
+        bag = ResourceBag()
+        request = Request(
+            scope={"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b""},
+            receive=receive,
+            state={},
+            exit_stack=bag,
+        )
+        try:
+            return await handler(request, params)
+        finally:
+            await bag.aclose()
+
+    return asyncio.run(run())
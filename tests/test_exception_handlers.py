@@ -20,3 +20,30 @@ def test_exception_handler_overrides_default_500():
 
     assert resp.status == 418
     assert resp.json()["detail"] == "boom"
+
+
+def test_exception_handler_registered_after_miss_is_used_for_subclass():
+    class AppError(Exception):
+        pass
+
+    class NotAllowed(AppError):
+        pass
+
+    async def fail():
+        raise NotAllowed("nope")
+
+    def handle_app_error(request: Request, exc: BaseException):
+        return {"detail": str(exc)}, 403
+
+    router = Router()
+    router.get("/fail", fail)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        before = client.get("/fail")
+        app.add_exception_handler(AppError, handle_app_error)
+        after = client.get("/fail")
+
+    assert before.status == 500
+    assert after.status == 403
+    assert after.json()["detail"] == "nope"
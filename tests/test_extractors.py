@@ -42,6 +42,8 @@ def test_normalize_extractor_with_class():
     normalized = normalize_extractor(Query)
 
     assert isinstance(normalized, Query)
+    assert normalize_extractor(Query) is normalized
+    assert normalized.name is None
 
 
 def test_normalize_extractor_unknown_returns_none():
@@ -63,6 +65,33 @@ def test_json_extractor_msgspec():
     assert resp.json()["user"] == "demo"
 
 
+def test_json_generic_body_builds_decoder_once(monkeypatch):
+    class Tag(msgspec.Struct):
+        name: str
+
+    created: list[object] = []
+    original = msgspec.json.Decoder
+
+    def counting_decoder(*args, **kwargs):
+        created.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(msgspec.json, "Decoder", counting_decoder)
+
+    async def create_tags(tags: Annotated[list[Tag], Json]):
+        return {"names": [tag.name for tag in tags]}
+
+    router = Router()
+    router.post("/tags", create_tags)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        responses = [client.post("/tags", json=[{"name": str(index)}]) for index in range(3)]
+
+    assert [resp.json()["names"] for resp in responses] == [["0"], ["1"], ["2"]]
+    assert created == [(list[Tag],)]
+
+
 def test_json_invalid_returns_422():
     async def create_user(payload: Annotated[CreateUser, Json]):
         return {"user": payload.username}
@@ -6,22 +6,20 @@ from bard import BardApp, File, Form, FormData, Router, TestClient, UploadFile
 
 
 def _multipart_body(boundary: str, fields: dict[str, str], files: dict[str, tuple[str, bytes, str]]) -> bytes:
-    lines: list[bytes] = []
+    parts: list[bytes] = []
     for name, value in fields.items():
-        lines.append(f"--{boundary}\r\n".encode("latin-1"))
-        lines.append(f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode("latin-1"))
-        lines.append(value.encode("utf-8"))
-        lines.append(b"\r\n")
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode("latin-1"))
+        parts.append(value.encode("utf-8"))
+        parts.append(b"\r\n")
     for name, (filename, content, content_type) in files.items():
-        lines.append(f"--{boundary}\r\n".encode("latin-1"))
-        lines.append(
-            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'.encode("latin-1")
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1")
         )
-        lines.append(f"Content-Type: {content_type}\r\n\r\n".encode("latin-1"))
-        lines.append(content)
-        lines.append(b"\r\n")
-    lines.append(f"--{boundary}--\r\n".encode("latin-1"))
-    return b"".join(lines)
+        parts.append(content)
+        parts.append(b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode("latin-1"))
+    return b"".join(parts)
 
 
 def test_form_urlencoded_field():
@@ -58,6 +56,28 @@ def test_form_urlencoded_list():
     assert resp.json()["tags"] == ["a", "b"]
 
 
+def test_form_urlencoded_decoding_and_blank_values():
+    async def handler(form: Annotated[FormData, Form]):
+        return {"fields": form.fields}
+
+    router = Router()
+    router.post("/submit", handler)
+    app = BardApp(router)
+
+    body = b"name=J%C3%BCrgen+Smith&empty=&flag&&tag=a&tag=b"
+    headers = {"content-type": "application/x-www-form-urlencoded"}
+
+    with TestClient(app) as client:
+        resp = client.request("POST", "/submit", body=body, headers=headers)
+
+    assert resp.json()["fields"] == {
+        "name": ["J\u00fcrgen Smith"],
+        "empty": [""],
+        "flag": [""],
+        "tag": ["a", "b"],
+    }
+
+
 def test_formdata_extractor():
     async def handler(form: Annotated[FormData, Form]):
         return {"fields": form.fields, "files": list(form.files.keys())}
@@ -120,6 +140,28 @@ def test_multipart_field_and_file():
     assert data["content"] == "hello"
 
 
+def test_multipart_file_content_with_embedded_blank_line():
+    async def handler(upload: Annotated[bytes, File("file")]):
+        return {"content": upload.decode("latin-1")}
+
+    router = Router()
+    router.post("/upload", handler)
+    app = BardApp(router)
+
+    boundary = "boundary123"
+    body = _multipart_body(
+        boundary,
+        fields={},
+        files={"file": ("data.bin", b"a\r\n\r\nb--boundary12\r\n", "application/octet-stream")},
+    )
+    headers = {"content-type": f"multipart/form-data; boundary={boundary}"}
+
+    with TestClient(app) as client:
+        resp = client.request("POST", "/upload", body=body, headers=headers)
+
+    assert resp.json()["content"] == "a\r\n\r\nb--boundary12\r\n"
+
+
 def test_multipart_file_bytes():
     async def handler(upload: Annotated[bytes, File("file")]):
         return {"size": len(upload)}
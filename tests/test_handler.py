@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import Annotated
 
 import pytest
 
-from bard import BardApp, Json, Path, Query, Router, TestClient
+from bard import BardApp, Header, Json, Path, Query, Router, State, TestClient
 from bard.extractors import _Extractor
 
 
@@ -22,6 +24,62 @@ def test_sync_handler_returns_value():
     assert resp.json()["ok"] is True
 
 
+def test_sync_handler_returning_awaitable_is_awaited():
+    async def load():
+        return {"ok": True}
+
+    def root():
+        return load()
+
+    router = Router()
+    router.get("/", root)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        resp = client.get("/")
+
+    assert resp.json()["ok"] is True
+
+
+def test_handler_mixes_positional_and_keyword_only_params():
+    async def handler(
+        item_id: Annotated[int, Path],
+        *,
+        q: Annotated[str, Query],
+        payload: Annotated[dict, Json],
+    ):
+        return {"item_id": item_id, "q": q, "payload": payload}
+
+    router = Router()
+    router.post("/items/{item_id}", handler)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        resp = client.post("/items/3?q=x", json={"a": 1})
+
+    assert resp.json() == {"item_id": 3, "q": "x", "payload": {"a": 1}}
+
+
+def test_handler_with_many_sync_extractors():
+    async def handler(
+        item_id: Annotated[int, Path],
+        q: Annotated[str, Query],
+        agent: Annotated[str, Header("user-agent")],
+        db: Annotated[str, State("db")],
+    ):
+        return {"item_id": item_id, "q": q, "agent": agent, "db": db}
+
+    router = Router()
+    router.get("/items/{item_id}", handler)
+    app = BardApp(router)
+    app.state["db"] = "primary"
+
+    with TestClient(app) as client:
+        resp = client.get("/items/7?q=x", headers={"user-agent": "probe"})
+
+    assert resp.json() == {"item_id": 7, "q": "x", "agent": "probe", "db": "primary"}
+
+
 def test_compile_handler_unsupported_param_kind():
     async def handler(*values: int):
         return {"values": values}
@@ -118,3 +176,118 @@ def test_non_pydantic_json_error_returns_500():
         resp = client.post("/items", json={"ok": True})
 
     assert resp.status == 500
+
+
+def test_handler_signature_is_introspected_once_across_routers(monkeypatch):
+    import bard.handler as handler_module
+
+    calls: list[object] = []
+    original = handler_module._function_parameters
+
+    def counting_parameters(obj):
+        calls.append(obj)
+        return original(obj)
+
+    async def handler(item_id: Annotated[int, Path]):
+        return {"item_id": item_id}
+
+    monkeypatch.setattr(handler_module, "_function_parameters", counting_parameters)
+
+    child = Router()
+    child.get("/items/{item_id}", handler)
+    parent = Router()
+    parent.include_router(child, prefix="/api")
+    app = BardApp(parent)
+
+    with TestClient(app) as client:
+        resp = client.get("/api/items/5")
+
+    assert resp.json()["item_id"] == 5
+    assert calls.count(handler) == 1
+
+
+def test_query_type_checks_run_at_compile_time(monkeypatch):
+    import bard.handler as handler_module
+
+    async def handler(
+        tags: Annotated[list[str], Query],
+        limit: Annotated[int | None, Query],
+        page: Annotated[int, Query] = 1,
+    ):
+        return {"tags": tags, "page": page, "limit": limit}
+
+    router = Router()
+    router.get("/items", handler)
+    app = BardApp(router)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("type introspection at request time")
+
+    monkeypatch.setattr(handler_module, "_is_list_type", fail)
+    monkeypatch.setattr(handler_module, "is_optional_type", fail)
+
+    with TestClient(app) as client:
+        resp = client.get("/items?tags=a&tags=b")
+
+    assert resp.json() == {"tags": ["a", "b"], "page": 1, "limit": None}
+
+
+def test_wrapped_handler_uses_wrapped_signature():
+    import functools
+
+    async def inner(item_id: Annotated[int, Path]):
+        return {"item_id": item_id}
+
+    @functools.wraps(inner)
+    async def handler(*args, **kwargs):
+        return await inner(*args, **kwargs)
+
+    router = Router()
+    router.get("/items/{item_id}", handler)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        resp = client.get("/items/7")
+
+    assert resp.json() == {"item_id": 7}
+
+
+def test_wrapped_kwargs_only_handler_is_called_by_keyword():
+    import functools
+
+    async def inner(item_id: Annotated[int, Path]):
+        return {"item_id": item_id}
+
+    @functools.wraps(inner)
+    async def handler(**kwargs):
+        return await inner(**kwargs)
+
+    router = Router()
+    router.get("/items/{item_id}", handler)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        resp = client.get("/items/7")
+
+    assert resp.status == 200
+    assert resp.json() == {"item_id": 7}
+
+
+def test_compiled_local_handlers_are_garbage_collected():
+    def build():
+        refs = []
+        for _ in range(20):
+
+            async def handler(item_id: Annotated[int, Query]):
+                return {"item_id": item_id}
+
+            router = Router()
+            router.get("/items", handler)
+            BardApp(router)
+            refs.append(weakref.ref(handler))
+        return refs
+
+    refs = build()
+    gc.collect()
+
+    assert [ref for ref in refs if ref() is not None] == []
@@ -57,3 +57,24 @@ def test_http_middleware_can_add_headers_via_tuple_response():
         resp = client.get("/")
 
     assert resp.headers["x-mw"] == "1"
+
+
+def test_http_middleware_added_after_first_request_applies():
+    async def handler():
+        return {"ok": True}
+
+    async def add_header(request: Request, call_next):
+        result = await call_next()
+        return result, 200, {"x-late": "1"}
+
+    router = Router()
+    router.get("/", handler)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        first = client.get("/")
+        app.add_middleware(add_header)
+        second = client.get("/")
+
+    assert "x-late" not in first.headers
+    assert second.headers["x-late"] == "1"
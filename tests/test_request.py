@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 
-from bard import BardApp, Request, Router, TestClient
+import pytest
+
+from bard import BardApp, Request, Response, Router, StreamingResponse, TestClient
 
 
 def test_request_injection():
@@ -111,6 +113,25 @@ def test_request_body_skips_non_request_messages():
     assert body == b"hello"
 
 
+def test_request_body_joins_chunks():
+    messages = [
+        {"type": "http.request", "body": b"hel", "more_body": True},
+        {"type": "http.request", "body": b"lo", "more_body": True},
+        {"type": "http.request", "body": b"", "more_body": False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    request = Request(
+        scope={"type": "http", "headers": [], "query_string": b""},
+        receive=receive,
+        state={},
+    )
+
+    assert asyncio.run(request.body()) == b"hello"
+
+
 def test_request_body_disconnect_returns_partial():
     async def receive_disconnect():
         return {"type": "http.disconnect"}
@@ -124,3 +145,134 @@ def test_request_body_disconnect_returns_partial():
     body = asyncio.run(request.body())
 
     assert body == b""
+
+
+def test_request_form_streams_chunked_multipart_body():
+    boundary = "chunked"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="name"\r\n\r\n'
+        "alice\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+        "0123456789\r\n"
+        f"--{boundary}--\r\n"
+    ).encode("latin-1")
+    chunks = [body[index : index + 5] for index in range(0, len(body), 5)]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    request = Request(
+        scope={
+            "type": "http",
+            "headers": [(b"content-type", f"multipart/form-data; boundary={boundary}".encode("latin-1"))],
+            "query_string": b"",
+        },
+        receive=receive,
+        state={},
+    )
+
+    async def run():
+        form = await request.form()
+        streamed = b"".join([chunk async for chunk in request.stream()])
+        return form, streamed, await request.body()
+
+    form, streamed, raw = asyncio.run(run())
+
+    assert form.get("name") == "alice"
+    assert form.get_file("file").content == b"0123456789"
+    assert messages == []
+    assert streamed == raw == body
+
+
+def test_request_raw_headers_are_lowercased_bytes():
+    request = Request(
+        scope={"type": "http", "headers": [(b"X-Token", b"Abc")], "query_string": b""},
+        receive=lambda: None,
+        state={},
+    )
+
+    assert request.raw_headers == {b"x-token": b"Abc"}
+    assert request.headers == {"x-token": "Abc"}
+
+
+def test_request_query_params_decoding():
+    request = Request(
+        scope={
+            "type": "http",
+            "headers": [],
+            "query_string": b"q=a+b%21&empty=&flag&name=%E2%9C%93&&q=c",
+        },
+        receive=lambda: None,
+        state={},
+    )
+
+    assert request.query_params == {
+        "q": ["a b!", "c"],
+        "empty": [""],
+        "flag": [""],
+        "name": ["✓"],
+    }
+
+
+def test_request_form_skips_body_without_form_payload():
+    async def receive():
+        raise AssertionError("body should not be read")
+
+    def make(method: str, headers: list[tuple[bytes, bytes]]) -> Request:
+        return Request(
+            scope={"type": "http", "method": method, "headers": headers, "query_string": b""},
+            receive=receive,
+            state={},
+        )
+
+    urlencoded = (b"content-type", b"application/x-www-form-urlencoded")
+    requests = [
+        make("GET", [urlencoded]),
+        make("POST", [urlencoded, (b"content-length", b"0")]),
+        make("POST", [(b"content-type", b"application/json")]),
+        make("POST", []),
+    ]
+
+    for request in requests:
+        form = asyncio.run(request.form())
+        assert form.fields == {} and form.files == {}
+
+
+def test_responses_use_slots_and_request_accepts_attributes():
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    request = Request({"type": "http", "headers": []}, receive, {})
+    request.user = "alice"
+
+    assert request.user == "alice"
+    for instance in (Response(b"ok"), StreamingResponse([b"ok"])):
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.extra = True
+
+
+def test_middleware_can_attach_request_attributes():
+    async def handler(request: Request):
+        return {"user": request.user}
+
+    async def auth(request: Request, call_next):
+        request.user = "alice"
+        return await call_next()
+
+    router = Router()
+    router.get("/me", handler)
+    app = BardApp(router)
+    app.add_middleware(auth)
+
+    with TestClient(app) as client:
+        resp = client.get("/me")
+
+    assert resp.json() == {"user": "alice"}
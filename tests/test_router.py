@@ -248,3 +248,96 @@ def test_include_router_prefix_root_path():
 
     assert resp1.json()["root"] is True
     assert resp2.json()["root"] is True
+
+
+def test_router_match_cache_is_invalidated_by_new_routes():
+    async def first():
+        return "first"
+
+    async def second():
+        return "second"
+
+    router = Router()
+    router.get("/a", first)
+    router.compile()
+
+    handler, params = router.match("GET", "/a")
+    cached_handler, cached_params = router.match("GET", "/a")
+    missing, _ = router.match("GET", "/b")
+    assert handler is cached_handler
+    assert params == {} and cached_params == {}
+    assert cached_params is not params
+    params["leak"] = "x"
+    assert router.match("GET", "/a")[1] == {}
+    assert router.match("GET", "/users")[1] == {}
+    assert missing is None
+
+    router.get("/b", second)
+    found, _ = router.match("GET", "/b")
+    assert found is not None
+
+
+def test_module_level_routes_share_the_module_namespace():
+    async def root():
+        return "ok"
+
+    namespace = {"Router": Router, "root": root}
+    exec("router = Router()\nrouter.get('/', root)\nrouter.get('/again', root)", namespace)
+    router = namespace["router"]
+
+    assert router._handler_localns[root] is namespace
+
+
+def test_router_nodes_are_slotted():
+    from bard.router import _Node
+
+    assert not hasattr(_Node(), "__dict__")
+
+
+def test_split_path_drops_empty_segments():
+    from bard.router import _split_path
+
+    assert _split_path("/") == []
+    assert _split_path("/users/42/") == ["users", "42"]
+    assert _split_path("//users//42") == ["users", "42"]
+
+
+@pytest.mark.parametrize(
+    ("registered", "requested", "matches"),
+    [
+        ("/", "/", True),
+        ("/", "", True),
+        ("/users", "/users/profile", False),
+        ("/users/{user_id}", "/users", False),
+        ("/trailing/slash/", "/trailing/slash", True),
+        ("/trailing", "/trailing/", True),
+    ],
+)
+def test_router_path_edge_cases(registered, requested, matches):
+    async def handler():
+        return "ok"
+
+    router = Router()
+    router.get(registered, handler)
+    router.compile()
+
+    routed, _ = router.match("GET", requested)
+
+    assert (routed is not None) is matches
+
+
+def test_router_match_builds_param_dicts():
+    async def handler():
+        return "ok"
+
+    router = Router()
+    router.get("/users/{user_id}", handler)
+    router.get("/users/{user_id}/posts/{post_id}", handler)
+    router.compile()
+
+    routed, params = router.match("GET", "/users/7")
+    assert routed is not None
+    assert params == {"user_id": "7"}
+    assert params is not router.match("GET", "/users/7")[1]
+    assert router.match("GET", "/users/7/posts/9")[1] == {"user_id": "7", "post_id": "9"}
+    assert router.match("POST", "/users/7") == (None, {})
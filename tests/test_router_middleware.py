@@ -61,3 +61,24 @@ def test_app_level_and_router_level_middleware_order():
 
     assert resp.json()["order"] == ["app-before", "router-before", "router-after", "app-after"]
 
+
+
+def test_router_middleware_added_after_app_creation_applies():
+    async def handler():
+        return {"ok": True}
+
+    async def late_mw(request: Request, call_next):
+        result = await call_next()
+        return result, 200, {"x-mw": "1"}
+
+    router = Router()
+    router.get("/ping", handler)
+    app = BardApp(router)
+
+    with TestClient(app) as client:
+        before = client.get("/ping")
+        router.add_middleware(late_mw)
+        after = client.get("/ping")
+
+    assert "x-mw" not in before.headers
+    assert after.headers["x-mw"] == "1"
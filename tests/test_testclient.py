@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from bard import BardApp, Router, TestClient
+from bard import BardApp, Request, Router, TestClient
 
 
 def test_testclient_exit_without_enter():
@@ -32,7 +32,7 @@ def test_testclient_json_and_body_error():
         client.request("GET", "/", json={"ok": True}, body=b"data")
 
 
-def test_testclient_without_context_uses_asyncio_run():
+def test_testclient_without_context_returns_response():
     async def root():
         return {"ok": True}
 
@@ -46,6 +46,62 @@ def test_testclient_without_context_uses_asyncio_run():
     assert resp.json()["ok"] is True
 
 
+def test_testclient_without_context_tears_down_leftovers():
+    events = []
+
+    async def background():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            events.append("task cancelled")
+            raise
+
+    async def ticks():
+        try:
+            yield 1
+            yield 2
+        finally:
+            events.append("agen closed")
+
+    async def root():
+        asyncio.get_running_loop().create_task(background())
+        agen = ticks()
+        await agen.__anext__()
+        root.agen = agen
+        return {"ok": True}
+
+    router = Router()
+    router.get("/", root)
+    app = BardApp(router)
+    client = TestClient(app)
+
+    resp = client.get("/")
+
+    assert resp.json()["ok"] is True
+    assert sorted(events) == ["agen closed", "task cancelled"]
+    client.close()
+
+
+def test_testclient_without_context_reuses_one_loop():
+    loops = []
+
+    async def root():
+        loops.append(asyncio.get_running_loop())
+        return {"ok": True}
+
+    router = Router()
+    router.get("/", root)
+    app = BardApp(router)
+    client = TestClient(app)
+
+    client.get("/")
+    client.get("/")
+    client.close()
+
+    assert loops[0] is loops[1]
+    assert loops[0].is_closed()
+
+
 def test_testclient_put_delete_helpers():
     async def put_handler():
         return {"method": "put"}
@@ -94,3 +150,39 @@ def test_testclient_receive_body_sent_branch():
     resp = client.request("POST", "/test", body=b"payload")
 
     assert resp.body == b"ok"
+
+
+def test_testclient_json_does_not_mutate_caller_headers():
+    async def echo(request: Request):
+        return {"content_type": request.headers["content-type"], "token": request.headers.get("x-token")}
+
+    router = Router()
+    router.post("/", echo)
+    app = BardApp(router)
+    headers = {"x-token": "abc"}
+
+    with TestClient(app) as client:
+        resp = client.post("/", json={"ok": True}, headers=headers)
+        custom = client.post("/", json={}, headers={"Content-Type": "application/vnd.test+json"})
+
+    assert headers == {"x-token": "abc"}
+    assert resp.json() == {"content_type": "application/json", "token": "abc"}
+    assert custom.json()["content_type"] == "application/vnd.test+json"
+
+
+def test_testclient_context_keeps_idle_loop_reachable_by_close():
+    async def root():
+        return {"ok": True}
+
+    router = Router()
+    router.get("/", root)
+    client = TestClient(BardApp(router))
+
+    client.get("/")
+    idle_loop = client._idle_loop
+    with client:
+        client.get("/")
+
+    assert client._idle_loop is idle_loop
+    client.close()
+    assert idle_loop.is_closed()
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+
+import msgspec
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from enum import Enum
+from typing import Annotated, Any, Optional, get_args
 
 from bard.utils import (
-    _convert_union,
+    _union_converter,
     convert_value,
     decode_json,
     encode_json,
+    is_awaitable,
     is_optional_type,
+    json_decoder,
+    value_converter,
 )
 
 
@@ -66,6 +73,13 @@ def test_is_optional_type_none():
     assert is_optional_type(type(None))[0] is True
 
 
+def test_is_optional_type_handles_unhashable_annotations():
+    unhashable = Annotated[int, {"meta": True}]
+
+    assert is_optional_type(unhashable) == (False, unhashable)
+    assert is_optional_type(Optional[int]) == (True, int)
+
+
 def test_convert_value_any():
     payload = {"hello": "bard"}
 
@@ -113,9 +127,132 @@ def test_convert_scalar_constructor_fallback():
     assert wrapped.value == 7
 
 
+def test_convert_union_none_short_circuits_members():
+    assert convert_value(None, str | int | None) is None
+    assert convert_value("5", int | str | None) == 5
+
+
 def test_convert_union_returns_value_on_all_none():
-    assert _convert_union("text", (type(None),)) == "text"
+    assert _union_converter((type(None),))("text") == "text"
 
 
 def test_convert_bool_identity():
     assert convert_value(True, bool) is True
+
+
+def test_is_awaitable_detects_coroutines_and_custom_awaitables():
+    class Custom:
+        def __await__(self):
+            yield from ()
+
+    async def coro():
+        return 1
+
+    pending = coro()
+    assert is_awaitable(pending) is True
+    assert is_awaitable(Custom()) is True
+    assert is_awaitable(asyncio.sleep) is False
+    assert is_awaitable({"ok": True}) is False
+    assert is_awaitable(None) is False
+    pending.close()
+
+
+def test_json_decoder_targets_structs_dataclasses_and_models():
+    class Point(msgspec.Struct):
+        x: int
+        y: int
+
+    @dataclass
+    class Size:
+        width: int
+
+    class User(BaseModel):
+        id: int
+
+    assert json_decoder(Point)(b'{"x": 1, "y": 2}') == Point(x=1, y=2)
+    assert json_decoder(Size)(b'{"width": 3}') == Size(width=3)
+    assert json_decoder(User)(b'{"id": 4}') == User(id=4)
+    assert json_decoder(Any)(b'[1, "a"]') == [1, "a"]
+
+    with pytest.raises(msgspec.ValidationError):
+        json_decoder(Point)(b'{"x": "bad", "y": 2}')
+    with pytest.raises(ValidationError):
+        json_decoder(User)(b'{"id": "bad"}')
+
+
+def test_value_converter_matches_convert_value():
+    cases = [
+        (int, "3"),
+        (Optional[int], None),
+        (list[int], ["1", "2"]),
+        (list[int], "4"),
+        (bool, "off"),
+        (bytes, "raw"),
+        (str, None),
+        (int | str, "x"),
+    ]
+
+    for target_type, value in cases:
+        assert value_converter(target_type)(value) == convert_value(value, target_type)
+
+    with pytest.raises(ValueError):
+        value_converter(int)("nope")
+
+
+def test_decode_json_reuses_typed_decoders():
+    from bard.utils import _json_decoder_for
+
+    @dataclass
+    class Size:
+        width: int
+
+    assert decode_json(b'{"width": 1}', Size) == Size(width=1)
+    assert decode_json(b'{"width": 2}', Size) == Size(width=2)
+    assert _json_decoder_for(Size) is _json_decoder_for(Size)
+
+
+def test_value_converter_is_cached_per_type():
+    assert value_converter(list[int]) is value_converter(list[int])
+    assert convert_value(["1", None], list[int | None]) == [1, None]
+
+
+def test_scalar_converters_dispatch_without_wrappers():
+    class Color(Enum):
+        RED = "red"
+
+    assert value_converter(int) is int
+    assert value_converter(float) is float
+    assert value_converter(Color) is Color
+    assert value_converter(Color)("red") is Color.RED
+
+
+def test_encode_json_structs_dataclasses_and_unsupported():
+    class Point(msgspec.Struct):
+        x: int
+
+    @dataclass
+    class Size:
+        width: int
+
+    assert encode_json(Point(x=1)) == b'{"x":1}'
+    assert encode_json(Size(width=2)) == b'{"width":2}'
+    with pytest.raises(TypeError):
+        encode_json(object())
+
+
+def test_convert_value_exact_type_is_returned_as_is():
+    values = ["a", "b"]
+
+    assert convert_value(values, list) is values
+    assert convert_value("x", str) == "x"
+    assert convert_value(3, int) == 3
+
+
+def test_value_converter_keeps_union_member_order():
+    assert convert_value("1", str | int) == "1"
+    assert convert_value("1", int | str) == 1
+    assert convert_value("1", str | int) == "1"
+    assert convert_value(["1"], list[str | int]) == ["1"]
+    assert convert_value(["1"], list[int | str]) == [1]
+    assert get_args(get_args(is_optional_type(list[str | int] | None)[1])[0]) == (str, int)
+    assert get_args(get_args(is_optional_type(list[int | str] | None)[1])[0]) == (int, str)
@@ -73,3 +73,30 @@ def test_websocket_extractors_and_path_params_work():
     assert sent[0]["type"] == "websocket.accept"
     assert sent[1]["type"] == "websocket.send"
     assert sent[1]["text"] == "alice:hello:Probe"
+
+
+def test_websocket_query_params_decoding():
+    ws = WebSocket(
+        scope={"type": "websocket", "headers": [], "query_string": b"room=a+b&tag=%E2%9C%93&tag=&flag"},
+        receive=None,
+        send=None,
+        state={},
+    )
+
+    assert ws.query_params == {"room": ["a b"], "tag": ["✓", ""], "flag": [""]}
+
+
+def test_websocket_query_params_empty_without_query_string():
+    ws = WebSocket(scope={"type": "websocket", "headers": []}, receive=None, send=None, state={})
+
+    assert ws.query_params == {}
+
+
+def test_websocket_di_cache_is_created_lazily():
+    ws = WebSocket(scope={"type": "websocket", "headers": []}, receive=None, send=None, state={})
+
+    assert ws._di_cache is None
+    ws.di_cache["key"] = 1
+    assert ws.di_cache == {"key": 1}
+    ws.user = "alice"
+    assert ws.user == "alice"